@@ -5,62 +5,151 @@ Ensures requirements.in and requirements.txt stay aligned and pinned.
 Run during build/deploy to prevent dependency drift.
 """
 
+import hashlib
+import json
+import mmap
+import os
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
+STAMP_FILE = ".forge-reqcheck-stamp"
+
+# Characters that can end a package name (specifier, extras or environment marker),
+# mapped to one sentinel so a single partition finds the boundary
+_NAME_END = "\x01"
+_NAME_END_TRANS = str.maketrans({c: _NAME_END for c in "=<>!~[;"})
+# Non-blank, non-comment line with any trailing " # comment" and whitespace stripped.
+# Matched on raw bytes so large files can be scanned through mmap without decoding them whole.
+_LINE_RE = re.compile(rb"(?m)^[ \t]*([^\s#][^\n]*?)(?:[ \t]+#[^\n]*)?[ \t\r]*$")
+
 def read_requirements_file(file_path: Path):
     """Read and parse a requirements file, ignoring comments and empty lines."""
     if not file_path.exists():
         return None, f"File {file_path.name} does not exist"
 
-    lines = []
     try:
-        with file_path.open() as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith("#"):
-                    continue
-                if " #" in line:
-                    line = line.split(" #")[0].strip()
-                lines.append(line)
-        return lines, None
+        with file_path.open("rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return [], None  # mmap cannot map an empty file
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return [line.decode("utf-8") for line in _LINE_RE.findall(mm)], None
     except Exception as e:
         return None, f"Error reading {file_path.name}: {str(e)}"
 
+@lru_cache(maxsize=4096)
 def extract_package_name(requirement_line: str):
     """Extract the package name from a requirement line."""
     line = requirement_line.strip()
     if line.startswith(("-e ", "git+", "http://", "https://")):
         return None
-    for specifier in ["==", ">=", "<=", "~=", ">", "<", "!="]:
-        if specifier in line:
-            return line.split(specifier)[0].strip().lower()
-    return line.lower()
+    return line.translate(_NAME_END_TRANS).partition(_NAME_END)[0].strip().lower()
 
 def check_for_unpinned(requirements):
     """Warn if any requirements are not pinned with ==."""
     return [req for req in requirements if "==" not in req and not req.startswith(("-e", "git+"))]
 
-def main():
-    req_in = Path("requirements.in")
-    req_txt = Path("requirements.txt")
+def build_index(requirements):
+    """Map each requirement's package name (or the raw line if unnamed) to its line."""
+    return {extract_package_name(line) or line: line for line in requirements}
+
+def load_requirements_index(file_path: Path):
+    """
+    Return ({package: line}, error) for a requirements file.
+    The parsed index is cached next to the file and reused while its mtime and size are unchanged.
+    """
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return None, f"File {file_path.name} does not exist"
+
+    key = f"{st.st_mtime_ns}:{st.st_size}"
+    cache_path = file_path.with_name(f"{file_path.name}.cache.json")
+    try:
+        cached = json.loads(cache_path.read_text())
+        if cached.get("key") == key:
+            return cached["index"], None
+    except (OSError, ValueError, AttributeError, KeyError):
+        pass
+
+    lines, err = read_requirements_file(file_path)
+    if err:
+        return None, err
+    index = build_index(lines)
+    try:
+        cache_path.write_text(json.dumps({"key": key, "index": index}))
+    except OSError:
+        pass  # read-only checkout: just skip caching
+    return index, None
+
+def compare_requirements(in_lines, txt_index):
+    """Return (missing, unpinned) for requirements.in lines vs the requirements.txt index."""
+    in_packages = {name: line for line in in_lines if (name := extract_package_name(line))}
+    missing = [in_packages[pkg] for pkg in in_packages if pkg not in txt_index]
+    return missing, check_for_unpinned(txt_index.values())
 
+def _inputs_digest(*paths: Path) -> str:
+    """Content hash of the given files, used to skip re-checking unchanged inputs."""
+    digest = hashlib.blake2b(digest_size=16)
+    for path in paths:
+        digest.update(path.read_bytes())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+def main(req_in: Path = Path("requirements.in"), req_txt: Path = Path("requirements.txt")) -> int:
+    """Run the sanity check and return a process exit code."""
     if not req_in.exists():
         print("❌ requirements.in missing - create it with your desired dependencies")
-        sys.exit(1)
+        return 1
     if not req_txt.exists():
         print("❌ requirements.txt missing - generate it with: pip-compile requirements.in")
-        sys.exit(1)
+        return 1
 
-    in_lines, err = read_requirements_file(req_in)
-    if err:
-        print(f"❌ {err}")
-        sys.exit(1)
+    # Inputs identical to the last successful run: nothing to re-check
+    stamp_path = req_in.with_name(STAMP_FILE)
+    digest = _inputs_digest(req_in, req_txt)
+    try:
+        if stamp_path.read_text().strip() == digest:
+            print("✅ Requirements unchanged since last successful check (cached)")
+            return 0
+    except OSError:
+        pass
+
+    # The two reads are independent blocking I/O: overlap them on a worker thread
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        in_future = executor.submit(read_requirements_file, req_in)
+        txt_index, txt_err = load_requirements_index(req_txt)
+        in_lines, in_err = in_future.result()
+
+    for err in (in_err, txt_err):
+        if err:
+            print(f"❌ {err}")
+            return 1
+
+    missing, unpinned = compare_requirements(in_lines, txt_index)
+
+    if missing or unpinned:
+        # Build the whole report first and emit it with a single write
+        report = []
+        if missing:
+            report.append("❌ Packages in requirements.in missing from requirements.txt:")
+            report.extend(f"   - {req}" for req in missing)
+        if unpinned:
+            report.append("❌ Unpinned requirements in requirements.txt:")
+            report.extend(f"   - {req}" for req in unpinned)
+        report.append("👉 Regenerate with: pip-compile requirements.in")
+        sys.stdout.write("\n".join(report) + "\n")
+        return 1
+
+    print(f"✅ Requirements aligned ({len(in_lines)} direct, {len(txt_index)} pinned)")
+    try:
+        stamp_path.write_text(digest)
+    except OSError:
+        pass
+    return 0
 
-    txt_lines, err = read_requirements_file(req_txt)
-    if err:
-        print(f"❌ {err}")
-        sys.exit(1)
 
-    in_packages = {extract_package_name(line): line for line in in_lines if extract_package_name(line)}
-    txt_packag_
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,4 +3,20 @@ Forge Core Package
 Provides utilities for prompt optimisation, packaging, safety, and integrations.
 """
 
-from . import prompts, package, safety, profiles, workflows
+import importlib
+
+# Submodules are imported on first attribute access (PEP 562) so `import forge`
+# does not pay for the whole stack when only one module is needed.
+_LAZY_SUBMODULES = {"prompts", "package", "safety", "profiles", "workflows"}
+
+
+def __getattr__(name):
+    if name in _LAZY_SUBMODULES:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | _LAZY_SUBMODULES)
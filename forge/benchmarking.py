@@ -1,8 +1,10 @@
+import os
+import re
+import sys
 import time
 import random
-import psutil
 import logging
-from typing import Dict, Any
+from typing import Any, Dict, Mapping, Optional, Tuple
 from enum import Enum
 from functools import wraps
 
@@ -25,26 +27,19 @@ class BenchmarkLevel(Enum):
     COMPREHENSIVE = "comprehensive"
 
 
-# Default config for benchmark levels
-_BENCHMARK_CONFIG = {
-    BenchmarkLevel.BASIC: {
-        BenchmarkCategory.QUALITY: True,
-        BenchmarkCategory.SPEED: True,
-    },
-    BenchmarkLevel.DETAILED: {
-        BenchmarkCategory.QUALITY: True,
-        BenchmarkCategory.SPEED: True,
-        BenchmarkCategory.EFFICIENCY: True,
-        BenchmarkCategory.FIDELITY: True,
-    },
-    BenchmarkLevel.COMPREHENSIVE: {
-        BenchmarkCategory.QUALITY: True,
-        BenchmarkCategory.SPEED: True,
-        BenchmarkCategory.EFFICIENCY: True,
-        BenchmarkCategory.FIDELITY: True,
-        BenchmarkCategory.MEMORY: True,
-        BenchmarkCategory.STABILITY: True,
-    },
+# Default config for benchmark levels: bit i enables the i-th BenchmarkCategory
+_CATEGORIES = tuple(BenchmarkCategory)
+
+_LEVEL_MASK = {
+    BenchmarkLevel.BASIC: 0b000011,          # quality, speed
+    BenchmarkLevel.DETAILED: 0b001111,       # + efficiency, fidelity
+    BenchmarkLevel.COMPREHENSIVE: 0b111111,  # + memory, stability
+}
+
+# Enabled categories per level, resolved once at import
+_ACTIVE_CATEGORIES = {
+    level: tuple(category for i, category in enumerate(_CATEGORIES) if mask >> i & 1)
+    for level, mask in _LEVEL_MASK.items()
 }
 
 
@@ -59,45 +54,133 @@ def timing_decorator(func):
     return wrapper
 
 
+_MEMINFO_RE = re.compile(rb"^(MemTotal|MemAvailable):\s+(\d+)", re.MULTILINE)
+_CPU_SAMPLE_INTERVAL = 0.1
+
+
+def _read_cpu_times() -> tuple[int, int]:
+    """Return (idle, total) jiffies from the aggregate cpu line of /proc/stat."""
+    with open("/proc/stat", "rb") as f:
+        values = [int(v) for v in f.readline().split()[1:]]
+    idle = values[3] + (values[4] if len(values) > 4 else 0)  # idle + iowait
+    return idle, sum(values)
+
+
+def _linux_metrics() -> Dict[str, Any]:
+    """Read system metrics straight from /proc and statvfs, without psutil."""
+    idle_start, total_start = _read_cpu_times()
+    time.sleep(_CPU_SAMPLE_INTERVAL)
+    idle_end, total_end = _read_cpu_times()
+    total_delta = total_end - total_start
+    cpu_percent = 100.0 * (1 - (idle_end - idle_start) / total_delta) if total_delta else 0.0
+
+    with open("/proc/meminfo", "rb") as f:
+        meminfo = {key: int(value) for key, value in _MEMINFO_RE.findall(f.read())}
+    mem_total = meminfo[b"MemTotal"]
+    memory_percent = 100.0 * (mem_total - meminfo[b"MemAvailable"]) / mem_total
+
+    disk = os.statvfs("/")
+    used = (disk.f_blocks - disk.f_bfree) * disk.f_frsize
+    usable = used + disk.f_bavail * disk.f_frsize
+    disk_percent = 100.0 * used / usable if usable else 0.0
+
+    return {
+        "cpu_percent": round(cpu_percent, 1),
+        "memory_percent": round(memory_percent, 1),
+        "disk_usage_percent": round(disk_percent, 1),
+    }
+
+
+def _psutil_metrics() -> Dict[str, Any]:
+    """Portable fallback for non-Linux hosts."""
+    import psutil
+
+    return {
+        "cpu_percent": psutil.cpu_percent(),
+        "memory_percent": psutil.virtual_memory().percent,
+        "disk_usage_percent": psutil.disk_usage('/').percent,
+    }
+
+
+# Seconds a successful metrics snapshot is reused; failed reads are never cached
+SYSTEM_METRICS_TTL = 5.0
+_metrics_cache: Optional[Tuple[float, Dict[str, Any]]] = None  # (monotonic time, metrics)
+
+
 def get_system_metrics() -> Dict[str, Any]:
-    """Get current system metrics."""
+    """
+    Get current system metrics.
+    A successful snapshot is reused for SYSTEM_METRICS_TTL seconds, since sampling CPU
+    takes _CPU_SAMPLE_INTERVAL; an empty dict means collection failed.
+    """
+    global _metrics_cache
+    now = time.monotonic()
+    if _metrics_cache is not None and now - _metrics_cache[0] < SYSTEM_METRICS_TTL:
+        return dict(_metrics_cache[1])
     try:
-        return {
-            "cpu_percent": psutil.cpu_percent(),
-            "memory_percent": psutil.virtual_memory().percent,
-            "disk_usage_percent": psutil.disk_usage('/').percent,
-        }
+        if sys.platform.startswith("linux"):
+            metrics = _linux_metrics()
+        else:
+            metrics = _psutil_metrics()
     except Exception as e:
         logger.exception(f"System metrics collection failed: {e}")
         return {}
+    _metrics_cache = (now, metrics)
+    return dict(metrics)
+
+
+# Simulated score range and weight per category: (low, high, weight)
+_SIMULATED_SCORES = {
+    BenchmarkCategory.QUALITY: (0.85, 0.98, 0.3),
+    BenchmarkCategory.SPEED: (0.75, 0.95, 0.25),
+    BenchmarkCategory.EFFICIENCY: (0.8, 0.94, 0.2),
+    BenchmarkCategory.FIDELITY: (0.88, 0.99, 0.15),
+    BenchmarkCategory.MEMORY: (0.7, 0.9, 0.05),
+    BenchmarkCategory.STABILITY: (0.92, 0.99, 0.05),
+}
+
+_timestamp_cache = [-1, ""]
+
+
+def _timestamp() -> str:
+    """Return the benchmark timestamp, formatting at most once per second."""
+    now = int(time.time())
+    if _timestamp_cache[0] != now:
+        _timestamp_cache[0] = now
+        _timestamp_cache[1] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.localtime(now))
+    return _timestamp_cache[1]
 
 
 def simulate_benchmark(category: BenchmarkCategory, seed: int | None = None) -> Dict[str, Any]:
     """Simulate benchmark results for category."""
     if seed is not None:
         random.seed(seed)
-    base_scores = {
-        BenchmarkCategory.QUALITY: {"score": random.uniform(0.85, 0.98), "weight": 0.3},
-        BenchmarkCategory.SPEED: {"score": random.uniform(0.75, 0.95), "weight": 0.25},
-        BenchmarkCategory.EFFICIENCY: {"score": random.uniform(0.8, 0.94), "weight": 0.2},
-        BenchmarkCategory.FIDELITY: {"score": random.uniform(0.88, 0.99), "weight": 0.15},
-        BenchmarkCategory.MEMORY: {"score": random.uniform(0.7, 0.9), "weight": 0.05},
-        BenchmarkCategory.STABILITY: {"score": random.uniform(0.92, 0.99), "weight": 0.05},
-    }
+    low, high, weight = _SIMULATED_SCORES[category]
     return {
-        "score": round(base_scores[category]["score"], 3),
-        "weight": base_scores[category]["weight"],
+        "score": round(random.uniform(low, high), 3),
+        "weight": weight,
         "status": "simulated",
-        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "timestamp": _timestamp(),
     }
 
 def run_benchmarks(level: BenchmarkLevel = BenchmarkLevel.BASIC, seed: int | None = None) -> Dict[str, Any]:
     """Run the selected benchmarks based on the level."""
     benchmark_results = {}
-    categories = _BENCHMARK_CONFIG.get(level, {})
 
-    for category, enabled in categories.items():
-        if enabled:
-            benchmark_results[category] = simulate_benchmark(category, seed)
+    for category in _ACTIVE_CATEGORIES.get(level, ()):
+        benchmark_results[category] = simulate_benchmark(category, seed)
 
     return benchmark_results
+
+
+def calculate_overall_score(benchmarks: Mapping[Any, Dict[str, Any]]) -> float:
+    """Weighted mean of the scores returned by run_benchmarks."""
+    total_weight = 0.0
+    weighted = 0.0
+    for result in benchmarks.values():
+        weight = result["weight"]
+        total_weight += weight
+        weighted += result["score"] * weight
+    if not total_weight:
+        return 0.0
+    return round(weighted / total_weight, 3)
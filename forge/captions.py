@@ -1,10 +1,12 @@
 # forge/captions.py
 import re
 import random
+import string
 import logging
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 from enum import Enum
 from datetime import datetime
+from itertools import chain
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
@@ -30,57 +32,125 @@ class Tone(Enum):
 # Template library for different caption styles
 CAPTION_TEMPLATES = {
     CaptionStyle.HOOK: {
-        Tone.NEUTRAL: [
+        Tone.NEUTRAL: (
             "✨ {prompt} - Crafted with precision",
             "🎨 {prompt} - AI artistry redefined",
             "⚡ {prompt} - Forged in digital fire"
-        ],
-        Tone.DRAMATIC: [
+        ),
+        Tone.DRAMATIC: (
             "🔥 {prompt} - Witness the future of creation",
             "⚔️ {prompt} - Where art meets algorithm",
             "🌌 {prompt} - Beyond imagination, rendered real"
-        ],
-        Tone.PROMOTIONAL: [
+        ),
+        Tone.PROMOTIONAL: (
             "🚀 {prompt} - Experience next-gen AI art",
             "🎯 {prompt} - Precision-engineered creativity",
             "💎 {prompt} - Premium AI artistry unleashed"
-        ]
+        )
     },
     CaptionStyle.NARRATIVE: {
-        Tone.STORYTELLING: [
+        Tone.STORYTELLING: (
             "This artwork tells the story of {prompt}, brought to life through advanced AI synthesis",
             "A visual narrative exploring {prompt}, created with cutting-edge generative technology",
             "In this scene: {prompt}. A moment captured through computational creativity"
-        ],
-        Tone.DRAMATIC: [
+        ),
+        Tone.DRAMATIC: (
             "Behold {prompt} - a dramatic vision forged in latent space",
             "Epic portrayal of {prompt}, rendered with cinematic intensity",
             "Grand vision of {prompt}, realized through algorithmic artistry"
-        ]
+        )
     },
     CaptionStyle.TECHNICAL: {
-        Tone.TECHNICAL: [
+        Tone.TECHNICAL: (
             "Technical breakdown: {prompt} | Optimized CFG: {cfg} | Steps: {steps} | Sampler: {sampler}",
             "AI Art Specification: {prompt} | Engineered with weighted emphasis and precision sampling",
             "Render Config: {prompt} | Validated resources + tuned parameters for optimal output"
-        ]
+        )
     },
     CaptionStyle.ACCESSIBILITY: {
-        Tone.NEUTRAL: [
+        Tone.NEUTRAL: (
             "Digital artwork depicting {prompt}. {details}",
             "AI-generated image showing {prompt}. Visual elements include {details}",
             "Computer-generated artwork featuring {prompt}. Composition includes {details}"
-        ]
+        )
     }
 }
 
 
+def _compile_template(template: str) -> Callable[..., str]:
+    """
+    Turn a str.format template into an equivalent f-string function, so the
+    template is parsed once at import rather than on every caption.
+    Templates are module constants, never user input.
+    """
+    fields = []
+    for _, field_name, format_spec, conversion in string.Formatter().parse(template):
+        if field_name is None:
+            continue
+        if format_spec or conversion or not field_name.isidentifier():
+            return template.format
+        if field_name not in fields:
+            fields.append(field_name)
+    params = "".join(f"{name}, " for name in fields)
+    return eval(f"lambda {params}**_: f{template!r}", {})
+
+
+def _compile_templates(templates: Tuple[str, ...]) -> Tuple[Callable[..., str], ...]:
+    return tuple(_compile_template(t) for t in templates)
+
+
+# Compiled templates keyed by raw tone string, with the per-style fallback already applied
+_HOOK_DEFAULT = _compile_templates(CAPTION_TEMPLATES[CaptionStyle.HOOK][Tone.NEUTRAL])
+_HOOK_TEMPLATES_BY_TONE = {
+    t.value: _compile_templates(CAPTION_TEMPLATES[CaptionStyle.HOOK][t])
+    if t in CAPTION_TEMPLATES[CaptionStyle.HOOK] else _HOOK_DEFAULT
+    for t in Tone
+}
+_NARRATIVE_DEFAULT = _compile_templates(
+    CAPTION_TEMPLATES[CaptionStyle.NARRATIVE][Tone.STORYTELLING]
+)
+_NARRATIVE_TEMPLATES_BY_TONE = {
+    t.value: _compile_templates(CAPTION_TEMPLATES[CaptionStyle.NARRATIVE][t])
+    if t in CAPTION_TEMPLATES[CaptionStyle.NARRATIVE] else _NARRATIVE_DEFAULT
+    for t in Tone
+}
+# Emoji run placed around social captions, per Tone member
+SOCIAL_EMOJIS = {
+    Tone.NEUTRAL: "✨🎨⚡",
+    Tone.DRAMATIC: "🔥⚔️🌌",
+    Tone.PROMOTIONAL: "🚀🎯💎"
+}
+# Social caption emoji wrappers keyed by raw tone string: (prefix, suffix)
+_SOCIAL_WRAP = {t.value: (f"{emojis} ", f" {emojis}") for t, emojis in SOCIAL_EMOJIS.items()}
+_SOCIAL_WRAP_DEFAULT = _SOCIAL_WRAP[Tone.NEUTRAL.value]
+_TECHNICAL_TEMPLATES = _compile_templates(CAPTION_TEMPLATES[CaptionStyle.TECHNICAL][Tone.TECHNICAL])
+
+
 # Hashtag collections
 HASHTAG_SETS = {
-    "default": ["aiart", "comfyui", "stablediffusion", "theforge", "generativeai"],
-    "technical": ["aiengineering", "promptdesign", "sdxl", "diffusionmodel", "techart"],
-    "creative": ["digitalart", "creativeai", "artisticai", "futureart", "neoart"],
-    "community": ["aiartcommunity", "genai", "machinelearningart", "computationalcreativity"]
+    "default": frozenset({"aiart", "comfyui", "stablediffusion", "theforge", "generativeai"}),
+    "technical": frozenset({"aiengineering", "promptdesign", "sdxl", "diffusionmodel", "techart"}),
+    "creative": frozenset({"digitalart", "creativeai", "artisticai", "futureart", "neoart"}),
+    "community": frozenset(
+        {"aiartcommunity", "genai", "machinelearningart", "computationalcreativity"}
+    ),
+}
+# Deterministic emission order for each set (frozenset iteration order is not stable)
+_HASHTAG_ORDER = {name: tuple(sorted(tags)) for name, tags in HASHTAG_SETS.items()}
+_MAX_HASHTAGS = 8
+
+
+# Prompt analysis vocabulary
+_WORD_RE = re.compile(r"\w+")
+STYLE_KEYWORDS = frozenset({"cyberpunk", "realistic", "anime", "fantasy", "cinematic", "painting"})
+MOOD_KEYWORDS = frozenset({"epic", "dark", "bright", "mysterious", "serene", "dramatic"})
+ENVIRONMENT_KEYWORDS = frozenset({"landscape", "portrait", "city", "nature", "space", "interior"})
+
+# word -> element bucket, so classification is one dict probe per word
+_WORD_BUCKET = {
+    **{word: "styles" for word in STYLE_KEYWORDS},
+    **{word: "moods" for word in MOOD_KEYWORDS},
+    **{word: "environments" for word in ENVIRONMENT_KEYWORDS},
 }
 
 
@@ -95,9 +165,41 @@ def generate_captions(
     """
     if profile is None:
         profile = {}
-    if seed is not None:
-        random.seed(seed)
+    # Local generator: seeding never touches the process-wide RNG shared by other requests
+    rng = random.Random(seed) if seed is not None else random
+
+    return _build_captions(prompt, caption, profile, rng, _utc_timestamp())
 
+
+def generate_captions_batch(
+    prompts: List[str],
+    captions: Optional[List[Optional[str]]] = None,
+    profile: Optional[Dict] = None,
+    seed: Optional[int] = None
+) -> List[Dict[str, str]]:
+    """
+    Generate captions for many prompts with one profile.
+    Profile defaults and the RNG are set up once for the whole batch; a seed makes
+    the batch reproducible as a whole.
+    """
+    if profile is None:
+        profile = {}
+    rng = random.Random(seed) if seed is not None else random
+    if captions is None:
+        captions = [None] * len(prompts)
+    elif len(captions) != len(prompts):
+        raise ValueError("captions must be the same length as prompts")
+
+    timestamp = _utc_timestamp()  # one timestamp for the whole batch
+    return [
+        _build_captions(prompt, caption, profile, rng, timestamp)
+        for prompt, caption in zip(prompts, captions)
+    ]
+
+
+def _build_captions(
+    prompt: str, caption: Optional[str], profile: Dict, rng, timestamp: str
+) -> Dict[str, str]:
     description = caption if caption else prompt
     tone = profile.get("tone", Tone.NEUTRAL.value)
     style_preference = profile.get("caption_style", "balanced")
@@ -105,13 +207,13 @@ def generate_captions(
     prompt_elements = _analyze_prompt(prompt)
 
     captions = {
-        "hook": _generate_hook(description, tone, prompt_elements),
-        "narrative": _generate_narrative(description, tone, prompt_elements),
-        "technical": _generate_technical(description, prompt_elements, profile),
+        "hook": _generate_hook(description, tone, prompt_elements, rng),
+        "narrative": _generate_narrative(description, tone, prompt_elements, rng),
+        "technical": _generate_technical(description, prompt_elements, profile, rng),
         "alt_text": _generate_alt_text(description, prompt_elements),
         "social": _generate_social(description, tone),
         "hashtags": _generate_hashtags(prompt_elements, style_preference),
-        "metadata": _generate_metadata(prompt, profile)
+        "metadata": _generate_metadata(prompt, profile, timestamp)
     }
 
     return _apply_profile_adaptations(captions, profile)
@@ -119,8 +221,11 @@ def generate_captions(
 
 def _analyze_prompt(prompt: str) -> Dict[str, List[str]]:
     """Analyze prompt to extract key elements for better caption generation."""
-    prompt_lower = prompt.lower()
-    words = re.findall(r"\w+", prompt_lower)
+    # The whole prompt is scanned: alt text joins every style, and the first mood or
+    # subjects can sit anywhere in a long prompt. The prompt is lowered before
+    # tokenising, not word by word: case folding can emit non-word characters
+    # ("İ" lowers to "i" + U+0307), which changes where \w+ splits words.
+    words = _WORD_RE.findall(prompt.lower())
 
     elements = {
         "subjects": [],
@@ -130,53 +235,39 @@ def _analyze_prompt(prompt: str) -> Dict[str, List[str]]:
         "keywords": list(dict.fromkeys(words[:10]))  # dedup first 10 words
     }
 
-    style_keywords = {"cyberpunk", "realistic", "anime", "fantasy", "cinematic", "painting"}
-    mood_keywords = {"epic", "dark", "bright", "mysterious", "serene", "dramatic"}
-    environment_keywords = {"landscape", "portrait", "city", "nature", "space", "interior"}
-
     for word in words:
-        if word in style_keywords:
-            elements["styles"].append(word)
-        elif word in mood_keywords:
-            elements["moods"].append(word)
-        elif word in environment_keywords:
-            elements["environments"].append(word)
+        bucket = _WORD_BUCKET.get(word)
+        if bucket:
+            elements[bucket].append(word)
         elif len(word) > 5:
             elements["subjects"].append(word)
 
     return elements
 
 
-def _generate_hook(description: str, tone: str, elements: Dict) -> str:
-    tone_enum = Tone(tone) if tone in [t.value for t in Tone] else Tone.NEUTRAL
-    templates = CAPTION_TEMPLATES[CaptionStyle.HOOK].get(
-        tone_enum, CAPTION_TEMPLATES[CaptionStyle.HOOK][Tone.NEUTRAL]
-    )
-    return random.choice(templates).format(prompt=description, mood=elements.get("moods", ["epic"])[0])
+def _generate_hook(description: str, tone: str, elements: Dict, rng=random) -> str:
+    templates = _HOOK_TEMPLATES_BY_TONE.get(tone, _HOOK_DEFAULT)
+    moods = elements["moods"]
+    return rng.choice(templates)(prompt=description, mood=moods[0] if moods else "epic")
 
 
-def _generate_narrative(description: str, tone: str, elements: Dict) -> str:
-    tone_enum = Tone(tone) if tone in [t.value for t in Tone] else Tone.STORYTELLING
-    templates = CAPTION_TEMPLATES[CaptionStyle.NARRATIVE].get(
-        tone_enum, CAPTION_TEMPLATES[CaptionStyle.NARRATIVE][Tone.STORYTELLING]
-    )
-    return random.choice(templates).format(prompt=description)
+def _generate_narrative(description: str, tone: str, elements: Dict, rng=random) -> str:
+    templates = _NARRATIVE_TEMPLATES_BY_TONE.get(tone, _NARRATIVE_DEFAULT)
+    return rng.choice(templates)(prompt=description)
 
 
-def _generate_technical(description: str, elements: Dict, profile: Dict) -> str:
+def _generate_technical(description: str, elements: Dict, profile: Dict, rng=random) -> str:
     technical_details = {
         "prompt": description,
         "cfg": profile.get("default_cfg_scale", "7.5"),
         "steps": profile.get("default_steps", "28"),
         "sampler": profile.get("preferred_sampler", "DPM++ 2M Karras")
     }
-    template = random.choice(CAPTION_TEMPLATES[CaptionStyle.TECHNICAL][Tone.TECHNICAL])
-    return template.format(**technical_details)
+    return rng.choice(_TECHNICAL_TEMPLATES)(**technical_details)
 
 
 def _generate_alt_text(description: str, elements: Dict) -> str:
-    subjects = elements.get("subjects", [])
-    styles = elements.get("styles", [])
+    subjects, styles = elements["subjects"], elements["styles"]
 
     if subjects and styles:
         alt_text = f"{' '.join(styles)} style artwork depicting {', '.join(subjects[:3])}"
@@ -187,34 +278,35 @@ def _generate_alt_text(description: str, elements: Dict) -> str:
 
 
 def _generate_social(description: str, tone: str) -> str:
-    emojis = {
-        Tone.NEUTRAL: "✨🎨⚡",
-        Tone.DRAMATIC: "🔥⚔️🌌",
-        Tone.PROMOTIONAL: "🚀🎯💎"
-    }
-    emoji_set = emojis.get(Tone(tone), emojis[Tone.NEUTRAL])
-    return f"{emoji_set} {description} {emoji_set}"
+    prefix, suffix = _SOCIAL_WRAP.get(tone, _SOCIAL_WRAP_DEFAULT)
+    return prefix + description + suffix
 
 
 def _generate_hashtags(elements: Dict, style: str) -> str:
-    tags = set(HASHTAG_SETS["default"])
-    if style == "technical":
-        tags.update(HASHTAG_SETS["technical"])
-    elif style == "creative":
-        tags.update(HASHTAG_SETS["creative"])
+    # Priority order: brand defaults, prompt styles, then the profile's style set
+    sources = [_HASHTAG_ORDER["default"], [s.lower() for s in elements["styles"][:2]]]
+    if style in ("technical", "creative"):
+        sources.append(_HASHTAG_ORDER[style])
+
+    tags = {}
+    for tag in chain.from_iterable(sources):
+        tags[tag] = None
+        if len(tags) == _MAX_HASHTAGS:
+            break
+
+    return " ".join(map("#{}".format, tags))
 
-    if elements.get("styles"):
-        tags.update([s.lower() for s in elements["styles"][:2]])
 
-    return " ".join([f"#{tag}" for tag in sorted(tags)[:8]])
+def _utc_timestamp() -> str:
+    return f"{datetime.utcnow().isoformat()}Z"
 
 
-def _generate_metadata(prompt: str, profile: Dict) -> str:
+def _generate_metadata(prompt: str, profile: Dict, timestamp: str) -> str:
     return (
         f"Prompt: {prompt} | "
         f"Profile: {profile.get('verbosity', 'normal')} | "
         f"Style: {profile.get('caption_style', 'balanced')} | "
-        f"Timestamp: {datetime.utcnow().isoformat()}Z"
+        f"Timestamp: {timestamp}"
     )
 
 
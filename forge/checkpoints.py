@@ -1,6 +1,6 @@
 # forge/checkpoints.py
 import logging
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from enum import Enum
 
 logger = logging.getLogger(__name__)
@@ -23,6 +23,70 @@ class CheckpointType(Enum):
     UPSCALE = "upscale"
 
 
+# Forge checkpoint registry, in declaration order
+_FORGE_CHECKPOINTS = (
+    {
+        "name": "forge-base-v1.safetensors",
+        "source": CheckpointSource.FORGE.value,
+        "type": CheckpointType.BASE.value,
+        "recommended_for": ("general", "balanced", "t2i"),
+        "resolution": "832x1216",
+        "default_cfg": 7.5,
+        "default_steps": 28,
+        "priority": 1,
+    },
+    {
+        "name": "forge-animate-v1.safetensors",
+        "source": CheckpointSource.FORGE.value,
+        "type": CheckpointType.VIDEO.value,
+        "recommended_for": ("video", "animation", "t2v", "i2v"),
+        "resolution": "768x768",
+        "default_cfg": 8.5,
+        "default_steps": 35,
+        "priority": 1,
+    },
+    {
+        "name": "forge-upscale-v1.safetensors",
+        "source": CheckpointSource.FORGE.value,
+        "type": CheckpointType.UPSCALE.value,
+        "recommended_for": ("upscaling", "detail-enhancement"),
+        "resolution": "1024x1024",
+        "default_cfg": 6.0,
+        "default_steps": 20,
+        "priority": 1,
+    },
+)
+
+_CHECKPOINTS_BY_NAME: Dict[str, Dict[str, Any]] = {c["name"]: c for c in _FORGE_CHECKPOINTS}
+
+# Config returned for checkpoints missing from the registry
+_FALLBACK_TEMPLATE: Dict[str, Any] = {
+    "source": CheckpointSource.LOCAL.value,
+    "type": CheckpointType.BASE.value,
+    "recommended_for": ("general",),
+    "resolution": "832x1216",
+    "default_cfg": 7.5,
+    "default_steps": 28,
+    "priority": 2,
+    "status": "unverified"
+}
+
+
+def _order_for_goal(goal: Optional[str]) -> Tuple[Dict[str, Any], ...]:
+    # Sort by priority → then relevance to goal → then name
+    return tuple(sorted(
+        _FORGE_CHECKPOINTS,
+        key=lambda x: (x["priority"], 0 if goal in x["recommended_for"] else 1, x["name"]),
+    ))
+
+
+# Suggestion order per known goal, prebuilt at import; unknown goals share the goal-less order
+_DEFAULT_ORDER = _order_for_goal(None)
+_ORDER_BY_GOAL: Dict[str, Tuple[Dict[str, Any], ...]] = {
+    goal: _order_for_goal(goal) for c in _FORGE_CHECKPOINTS for goal in c["recommended_for"]
+}
+
+
 def suggest_checkpoints(
     preferred_checkpoint: Optional[str] = None,
     prompt: Optional[str] = None,
@@ -32,83 +96,28 @@ def suggest_checkpoints(
     Suggest appropriate model checkpoints based on prompt and goal.
     Returns a list of recommended checkpoint configurations.
     """
-    forge_checkpoints = [
-        {
-            "name": "forge-base-v1.safetensors",
-            "source": CheckpointSource.FORGE.value,
-            "type": CheckpointType.BASE.value,
-            "recommended_for": ["general", "balanced", "t2i"],
-            "resolution": "832x1216",
-            "default_cfg": 7.5,
-            "default_steps": 28,
-            "priority": 1,
-        },
-        {
-            "name": "forge-animate-v1.safetensors",
-            "source": CheckpointSource.FORGE.value,
-            "type": CheckpointType.VIDEO.value,
-            "recommended_for": ["video", "animation", "t2v", "i2v"],
-            "resolution": "768x768",
-            "default_cfg": 8.5,
-            "default_steps": 35,
-            "priority": 1,
-        },
-        {
-            "name": "forge-upscale-v1.safetensors",
-            "source": CheckpointSource.FORGE.value,
-            "type": CheckpointType.UPSCALE.value,
-            "recommended_for": ["upscaling", "detail-enhancement"],
-            "resolution": "1024x1024",
-            "default_cfg": 6.0,
-            "default_steps": 20,
-            "priority": 1,
-        },
-    ]
-
-    # Specific checkpoint requested → prioritise
-    if preferred_checkpoint:
-        for checkpoint in forge_checkpoints:
-            if checkpoint["name"] == preferred_checkpoint:
-                checkpoint["priority"] = 0
-                return [checkpoint] + [
-                    c for c in forge_checkpoints if c["name"] != preferred_checkpoint
-                ]
+    # Specific checkpoint requested → prioritise, keep the rest in registry order
+    preferred = _CHECKPOINTS_BY_NAME.get(preferred_checkpoint) if preferred_checkpoint else None
+    if preferred:
+        return [{**preferred, "priority": 0}] + [
+            dict(c) for c in _FORGE_CHECKPOINTS if c is not preferred
+        ]
 
-    # Sort by priority → then relevance to goal → then name
-    sorted_checkpoints = sorted(
-        forge_checkpoints,
-        key=lambda x: (
-            x["priority"],
-            0 if goal in x["recommended_for"] else 1,
-            x["name"],
-        ),
-    )
-    return sorted_checkpoints
+    # Hand out copies so callers can't mutate the shared registry
+    return [dict(c) for c in _ORDER_BY_GOAL.get(goal, _DEFAULT_ORDER)]
 
 
 def get_checkpoint_config(checkpoint_name: str) -> Dict[str, Any]:
     """
     Get specific configuration for a checkpoint.
     """
-    all_checkpoints = suggest_checkpoints()
-
-    for checkpoint in all_checkpoints:
-        if checkpoint["name"] == checkpoint_name:
-            return checkpoint
+    checkpoint = _CHECKPOINTS_BY_NAME.get(checkpoint_name)
+    if checkpoint:
+        return dict(checkpoint)
 
     # Unknown checkpoint → return fallback
     logger.warning(f"Checkpoint {checkpoint_name} not found. Returning unverified config.")
-    return {
-        "name": checkpoint_name,
-        "source": CheckpointSource.LOCAL.value,
-        "type": CheckpointType.BASE.value,
-        "recommended_for": ["general"],
-        "resolution": "832x1216",
-        "default_cfg": 7.5,
-        "default_steps": 28,
-        "priority": 2,
-        "status": "unverified"
-    }
+    return {"name": checkpoint_name, **_FALLBACK_TEMPLATE}
 
 
 def fetch_civitai_metadata(model_id: str) -> Dict[str, Any]:
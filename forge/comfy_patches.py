@@ -2,10 +2,27 @@
 # 🔒 PRIVATE IMPLEMENTATION - Generates ComfyUI JSON patches
 
 import logging
-from typing import Any, Dict
+from functools import lru_cache
+from typing import Any, Dict, Hashable, List, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Forge setting → KSampler input
+_KSAMPLER_PARAMS = (
+    ("sampler", "sampler_name"),
+    ("scheduler", "scheduler"),
+    ("steps", "steps"),
+    ("cfg_scale", "cfg"),
+    ("seed", "seed"),
+    ("batch_size", "batch_size"),
+    ("clip_skip", "clip_skip"),
+    ("denoise", "denoise"),
+)
+
+# Every setting the patch depends on except the seed; their values form the cache key.
+# The seed differs on almost every request, so it is written in after the lookup.
+_PATCH_KEYS = tuple(key for key, _ in _KSAMPLER_PARAMS if key != "seed") + ("resolution",)
+
 
 def generate_workflow_patch(settings: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -23,20 +40,10 @@ def generate_workflow_patch(settings: Dict[str, Any]) -> Dict[str, Any]:
 
     # KSampler node
     sampler_params = {}
-    mapping = {
-        "sampler": "sampler_name",
-        "scheduler": "scheduler",
-        "steps": "steps",
-        "cfg_scale": "cfg",
-        "seed": "seed",
-        "batch_size": "batch_size",
-        "clip_skip": "clip_skip",
-        "denoise": "denoise",
-    }
-
-    for key, target in mapping.items():
-        if key in settings and settings[key] is not None:
-            sampler_params[target] = settings[key]
+    for key, target in _KSAMPLER_PARAMS:
+        value = settings.get(key)
+        if value is not None:
+            sampler_params[target] = value
 
     if sampler_params:
         patch["nodes"].append({
@@ -46,15 +53,58 @@ def generate_workflow_patch(settings: Dict[str, Any]) -> Dict[str, Any]:
         })
 
     # Resolution node
-    if "resolution" in settings and settings["resolution"] != "match_input":
+    resolution = settings.get("resolution")
+    if resolution is not None and resolution != "match_input":
         try:
-            width, height = map(int, settings["resolution"].split("x"))
+            width, height = map(int, resolution.split("x"))
             patch["nodes"].append({
                 "op": "set",
                 "node": "EmptyLatentImage",
                 "params": {"width": width, "height": height}
             })
         except Exception:
-            logger.warning(f"Invalid resolution format: {settings['resolution']} (expected 'WxH')")
+            logger.warning(f"Invalid resolution format: {resolution} (expected 'WxH')")
 
     return patch
+
+
+def cached_workflow_patch(settings: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Like generate_workflow_patch, but memoised on the settings the patch reads.
+    The node dicts are shared between calls and must be treated as read-only.
+    """
+    # The type is part of the key so 20 and 20.0 (or 1 and True) never share an entry
+    key = tuple((type(v), v) for v in map(settings.get, _PATCH_KEYS))
+    try:
+        nodes = list(_cached_nodes(key))
+    except TypeError:
+        # Unhashable setting value; nothing to key on
+        return generate_workflow_patch(settings)
+
+    seed = settings.get("seed")
+    if seed is not None:
+        _set_seed(nodes, seed)
+    return {"nodes": nodes}
+
+
+def _set_seed(nodes: List[Dict[str, Any]], seed: Any) -> None:
+    """Swap in a KSampler node carrying the seed, leaving the cached node untouched."""
+    index = next((i for i, node in enumerate(nodes) if node["node"] == "KSampler"), None)
+    cached = nodes[index]["params"] if index is not None else {}
+    # Rebuilt in _KSAMPLER_PARAMS order so the result matches generate_workflow_patch
+    params = {
+        target: seed if target == "seed" else cached[target]
+        for _, target in _KSAMPLER_PARAMS
+        if target == "seed" or target in cached
+    }
+    node = {"op": "set", "node": "KSampler", "params": params}
+    if index is None:
+        nodes.insert(0, node)
+    else:
+        nodes[index] = node
+
+
+@lru_cache(maxsize=1024)
+def _cached_nodes(key: Tuple[Tuple[type, Hashable], ...]) -> Tuple[Dict[str, Any], ...]:
+    settings = {name: value for name, (_, value) in zip(_PATCH_KEYS, key)}
+    return tuple(generate_workflow_patch(settings)["nodes"])
@@ -1,11 +1,11 @@
 import os
 import logging
 import json
-from typing import List, Union, Any
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Tuple
 from pathlib import Path
 from dotenv import load_dotenv
-from pydantic_settings import BaseSettings
-from pydantic import Field, field_validator
 
 # Load .env from the correct location if it exists
 env_path = Path("forge-service") / ".env"
@@ -16,88 +16,111 @@ else:
 
 logger = logging.getLogger(__name__)
 
-class Settings(BaseSettings):
+_TRUE_VALUES = {"1", "true", "yes", "on"}
+_FALSE_VALUES = {"0", "false", "no", "off", ""}
+_VALID_PORTS = range(1, 65536)
+
+_DEFAULT_CORS_ORIGINS = ("*",)
+_DEFAULT_CHROMA_CORS_ORIGINS = ("http://localhost:3000",)
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    value = value.strip().lower()
+    if value in _TRUE_VALUES:
+        return True
+    if value in _FALSE_VALUES:
+        return False
+    raise ValueError(f"{name} must be a boolean, got {value!r}")
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.environ.get(name)
+    if value is None or not value.strip():
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"{name} must be an integer, got {value!r}") from None
+
+
+def _env_port(name: str, default: int) -> int:
+    port = _env_int(name, default)
+    if port not in _VALID_PORTS:
+        raise ValueError(f"{name} must be between 1 and 65535, got {port}")
+    return port
+
+
+def _parse_origins(name: str, default: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Parse a CORS origin tuple from a JSON array, '*' or a comma-separated string."""
+    v = os.environ.get(name)
+    if v is None:
+        return default
+
+    v = v.strip()
+    # Handle JSON array format
+    if v.startswith('[') and v.endswith(']'):
+        try:
+            return tuple(str(origin) for origin in json.loads(v))
+        except json.JSONDecodeError:
+            logger.warning(f"Invalid JSON in {name}: {v}")
+            return default
+    # Handle wildcard or comma-separated
+    if v == "*":
+        return ("*",)
+    return tuple(origin.strip() for origin in v.split(",") if origin.strip())
+
+
+@dataclass(frozen=True)
+class Settings:
     app_name: str = "Forge API"
     version: str = "v2.0"
-    environment: str = Field(default="production", env="ENV")
-    debug: bool = Field(default=False, env="DEBUG")
+    environment: str = "production"
+    debug: bool = False
+
+    port: int = 8000
+
+    cors_origins: Tuple[str, ...] = _DEFAULT_CORS_ORIGINS
 
-    port: int = Field(default=8000, env="PORT")
-    
-    # ✅ Use Any type and let validator handle conversion
-    cors_origins: Any = Field(default="*", env="CORS_ORIGINS")
-    
-    enable_legacy: bool = Field(default=True, env="FORGE_ENABLE_LEGACY")
+    enable_legacy: bool = True
 
     # Chroma DB Configuration
-    chroma_server_host: str = Field(default="0.0.0.0", env="CHROMA_SERVER_HOST")
-    chroma_server_http_port: int = Field(default=8000, env="CHROMA_SERVER_HTTP_PORT")
-    chroma_server_grpc_port: int = Field(default=50051, env="CHROMA_SERVER_GRPC_PORT")
-    chroma_server_cors_allow_origins: Any = Field(
-        default="http://localhost:3000",
-        env="CHROMA_SERVER_CORS_ALLOW_ORIGINS"
-    )
-    chroma_persist_directory: str = Field(default="./chroma_db", env="CHROMA_PERSIST_DIRECTORY")
-
-    class Config:
-        env_file_encoding = "utf-8"
-        case_sensitive = False
-
-    @field_validator("cors_origins", mode="before")
-    def parse_cors_origins(cls, v):
-        """Parse CORS_ORIGINS from string to list"""
-        if v is None:
-            return ["*"]
-        
-        if isinstance(v, list):
-            return v
-            
-        if isinstance(v, str):
-            v = v.strip()
-            # Handle JSON array format
-            if v.startswith('[') and v.endswith(']'):
-                try:
-                    return json.loads(v)
-                except json.JSONDecodeError:
-                    logger.warning(f"Invalid JSON in CORS_ORIGINS: {v}")
-                    return ["*"]
-            # Handle wildcard or comma-separated
-            if v == "*":
-                return ["*"]
-            return [origin.strip() for origin in v.split(",") if origin.strip()]
-        
-        return ["*"]
-
-    @field_validator("chroma_server_cors_allow_origins", mode="before")
-    def parse_chroma_cors_origins(cls, v):
-        """Parse CHROMA_SERVER_CORS_ALLOW_ORIGINS from string to list"""
-        if v is None:
-            return ["http://localhost:3000"]
-        
-        if isinstance(v, list):
-            return v
-            
-        if isinstance(v, str):
-            v = v.strip()
-            # Handle JSON array format
-            if v.startswith('[') and v.endswith(']'):
-                try:
-                    return json.loads(v)
-                except json.JSONDecodeError:
-                    logger.warning(f"Invalid JSON in CHROMA_SERVER_CORS_ALLOW_ORIGINS: {v}")
-                    return ["http://localhost:3000"]
-            # Handle wildcard or comma-separated
-            if v == "*":
-                return ["*"]
-            return [origin.strip() for origin in v.split(",") if origin.strip()]
-        
-        return ["http://localhost:3000"]
-
-    # ... keep the port validators the same ...
+    chroma_server_host: str = "0.0.0.0"
+    chroma_server_http_port: int = 8000
+    chroma_server_grpc_port: int = 50051
+    chroma_server_cors_allow_origins: Tuple[str, ...] = _DEFAULT_CHROMA_CORS_ORIGINS
+    chroma_persist_directory: str = "./chroma_db"
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        """Build settings from environment variables (see .env)."""
+        return cls(
+            environment=os.environ.get("ENV", "production"),
+            debug=_env_bool("DEBUG", False),
+            port=_env_port("PORT", 8000),
+            cors_origins=_parse_origins("CORS_ORIGINS", _DEFAULT_CORS_ORIGINS),
+            enable_legacy=_env_bool("FORGE_ENABLE_LEGACY", True),
+            chroma_server_host=os.environ.get("CHROMA_SERVER_HOST", "0.0.0.0"),
+            chroma_server_http_port=_env_port("CHROMA_SERVER_HTTP_PORT", 8000),
+            chroma_server_grpc_port=_env_port("CHROMA_SERVER_GRPC_PORT", 50051),
+            chroma_server_cors_allow_origins=_parse_origins(
+                "CHROMA_SERVER_CORS_ALLOW_ORIGINS", _DEFAULT_CHROMA_CORS_ORIGINS
+            ),
+            chroma_persist_directory=os.environ.get("CHROMA_PERSIST_DIRECTORY", "./chroma_db"),
+        )
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Load settings from the environment once; later calls reuse the same instance."""
+    return Settings.from_env()
+
 
 # Create settings instance
 try:
-    settings = Settings()
+    settings = get_settings()
     logger.info(f"✅ Successfully loaded config for {settings.app_name} v{settings.version}")
     logger.info(f"📍 Environment: {settings.environment}")
     logger.info(f"🌐 CORS origins: {settings.cors_origins}")
@@ -1,5 +1,8 @@
 # forge/diagnostics.py
-from typing import Dict, List, Any, Optional
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
+from bisect import bisect_right
+from collections import Counter
+from dataclasses import dataclass
 from enum import Enum
 import random
 import logging
@@ -23,39 +26,54 @@ class SettingCategory(Enum):
     CHECKPOINT = "checkpoint"
 
 
+_CATEGORY_BY_VALUE: Dict[str, SettingCategory] = {c.value: c for c in SettingCategory}
+_VALID_KEYS: FrozenSet[str] = frozenset(_CATEGORY_BY_VALUE)
+
+
+@dataclass(frozen=True)
+class SamplerInfo:
+    """Static knowledge about one sampler."""
+    __slots__ = ("strengths", "weaknesses", "alternatives", "recommendation")
+
+    strengths: Tuple[str, ...]
+    weaknesses: Tuple[str, ...]
+    alternatives: Tuple[Tuple[str, str], ...]  # (sampler name, comparison)
+    recommendation: str
+
+
 # Knowledge base for diagnostics
 DIAGNOSTIC_KNOWLEDGE = {
     SettingCategory.SAMPLER: {
-        "DPM++ 2M Karras": {
-            "strengths": ["excellent detail", "stable convergence", "good for complex prompts"],
-            "weaknesses": ["slower than some alternatives"],
-            "alternatives": {
-                "Euler a": "faster, more creative but less precise",
-                "LMS": "good for smooth results, less detailed",
-                "DDIM": "classic, predictable but slower"
-            },
-            "recommendation": "Ideal for detailed scenes and complex compositions"
-        },
-        "Euler a": {
-            "strengths": ["fast", "creative variations", "good for exploration"],
-            "weaknesses": ["less consistent", "can miss details"],
-            "alternatives": {
-                "DPM++ 2M Karras": "slower but more precise and detailed",
-                "DPM2": "more stable but slower",
-                "Heun": "high quality but very slow"
-            },
-            "recommendation": "Great for quick iterations and creative exploration"
-        },
-        "LMS": {
-            "strengths": ["smooth results", "good for portraits", "stable"],
-            "weaknesses": ["can be too smooth", "loses fine details"],
-            "alternatives": {
-                "DPM++ 2M Karras": "better for detailed scenes",
-                "Euler a": "more creative variations",
-                "DPM2 a": "good balance of speed and quality"
-            },
-            "recommendation": "Excellent for portraits and smooth artistic styles"
-        }
+        "DPM++ 2M Karras": SamplerInfo(
+            strengths=("excellent detail", "stable convergence", "good for complex prompts"),
+            weaknesses=("slower than some alternatives",),
+            alternatives=(
+                ("Euler a", "faster, more creative but less precise"),
+                ("LMS", "good for smooth results, less detailed"),
+                ("DDIM", "classic, predictable but slower")
+            ),
+            recommendation="Ideal for detailed scenes and complex compositions"
+        ),
+        "Euler a": SamplerInfo(
+            strengths=("fast", "creative variations", "good for exploration"),
+            weaknesses=("less consistent", "can miss details"),
+            alternatives=(
+                ("DPM++ 2M Karras", "slower but more precise and detailed"),
+                ("DPM2", "more stable but slower"),
+                ("Heun", "high quality but very slow")
+            ),
+            recommendation="Great for quick iterations and creative exploration"
+        ),
+        "LMS": SamplerInfo(
+            strengths=("smooth results", "good for portraits", "stable"),
+            weaknesses=("can be too smooth", "loses fine details"),
+            alternatives=(
+                ("DPM++ 2M Karras", "better for detailed scenes"),
+                ("Euler a", "more creative variations"),
+                ("DPM2 a", "good balance of speed and quality")
+            ),
+            recommendation="Excellent for portraits and smooth artistic styles"
+        )
     },
     SettingCategory.CFG: {
         "ranges": {
@@ -75,6 +93,45 @@ DIAGNOSTIC_KNOWLEDGE = {
     }
 }
 
+# Flattened views of the knowledge base used by the per-category explainers
+_SAMPLER_KNOWLEDGE: Dict[str, SamplerInfo] = DIAGNOSTIC_KNOWLEDGE[SettingCategory.SAMPLER]
+_CFG_RANGES = tuple(DIAGNOSTIC_KNOWLEDGE[SettingCategory.CFG]["ranges"].values())
+# The CFG ranges are contiguous, so each one's lower bound plus the last upper
+# bound give bisect boundaries; index i falls in range i
+_CFG_BOUNDS = tuple(lo for lo, _, _ in _CFG_RANGES) + (_CFG_RANGES[-1][1],)
+_CFG_DESCRIPTIONS = tuple(desc for _, _, desc in _CFG_RANGES)
+_COMMON_ASPECTS = tuple(
+    tuple(entry)
+    for entry in DIAGNOSTIC_KNOWLEDGE[SettingCategory.RESOLUTION]["common_aspects"].values()
+)
+# Resolution string -> (aspect, description, note)
+_RES_BY_STRING: Dict[str, Tuple[str, str, str]] = {
+    res: (aspect, desc, note)
+    for aspect, (res, desc, note)
+    in DIAGNOSTIC_KNOWLEDGE[SettingCategory.RESOLUTION]["common_aspects"].items()
+}
+
+# Alternatives lists are static, so format them once
+_SAMPLER_ALTERNATIVES: Dict[str, Tuple[str, ...]] = {
+    name: tuple(f"{alt}: {desc}" for alt, desc in info.alternatives)
+    for name, info in _SAMPLER_KNOWLEDGE.items()
+}
+_RESOLUTION_ALTERNATIVES = tuple(f"{res}: {desc}" for res, desc, _ in _COMMON_ASPECTS)
+
+# Step and denoise bands: bisect_right over the thresholds indexes the reason
+_STEPS_THRESHOLDS = (20, 40)
+_STEPS_REASONS = (
+    "Fast generation, suitable for quick iterations",
+    "Balanced quality and speed, good for most purposes",
+    "High quality generation, best for final renders"
+)
+_DENOISE_THRESHOLDS = (0.3, 0.6)
+_DENOISE_REASONS = (
+    "Minimal changes, preserves original structure",
+    "Balanced transformation, good for most edits",
+    "Significant transformation, creative reinterpretation"
+)
+
 
 def generate_diagnostics(
     settings: Dict[str, Any],
@@ -83,8 +140,7 @@ def generate_diagnostics(
     seed: Optional[int] = None
 ) -> Dict[str, Any]:
     """Generate comprehensive diagnostics explaining optimization choices."""
-    if seed is not None:
-        random.seed(seed)
+    rng = random.Random(seed) if seed is not None else random
 
     diagnostics = {
         "settings_explanations": {},
@@ -96,23 +152,28 @@ def generate_diagnostics(
     }
 
     for setting_key, setting_value in settings.items():
-        if setting_key in [cat.value for cat in SettingCategory]:
-            explanation = _explain_setting(setting_key, setting_value, level)
+        if setting_key in _VALID_KEYS:
+            explanation = _explain_setting(setting_key, setting_value, level, rng)
             if explanation:
                 diagnostics["settings_explanations"][setting_key] = explanation
 
-    diagnostics["performance_considerations"] = _generate_performance_notes(settings)
+    # Basic diagnostics only explain the chosen settings
+    if level is DiagnosticLevel.BASIC:
+        diagnostics["recommendations"] = []
+    else:
+        diagnostics["performance_considerations"] = _generate_performance_notes(settings)
+        diagnostics["recommendations"] = _generate_recommendations(settings, resources)
     diagnostics["summary"] = _generate_summary(diagnostics, settings, resources)
-    diagnostics["recommendations"] = _generate_recommendations(settings, resources)
 
     return diagnostics
 
 
-def _explain_setting(setting_key: str, setting_value: Any, level: DiagnosticLevel) -> Optional[Dict[str, Any]]:
+def _explain_setting(
+    setting_key: str, setting_value: Any, level: DiagnosticLevel, rng=random
+) -> Optional[Dict[str, Any]]:
     """Generate explanation for a specific setting."""
-    try:
-        category = SettingCategory(setting_key)
-    except ValueError:
+    category = _CATEGORY_BY_VALUE.get(setting_key)
+    if category is None:
         return None
 
     explanation = {
@@ -122,79 +183,108 @@ def _explain_setting(setting_key: str, setting_value: Any, level: DiagnosticLeve
         "technical_notes": ""
     }
 
-    if category == SettingCategory.SAMPLER:
-        sampler_info = DIAGNOSTIC_KNOWLEDGE[category].get(setting_value, {})
-        if sampler_info:
-            explanation["reason"] = f"Selected for {random.choice(sampler_info['strengths'])}"
-            explanation["alternatives"] = [
-                f"{alt}: {desc}" for alt, desc in sampler_info["alternatives"].items()
-            ]
-            explanation["technical_notes"] = sampler_info["recommendation"]
-
-    elif category == SettingCategory.CFG:
-        try:
-            cfg_value = float(setting_value)
-            for _, (min_val, max_val, description) in DIAGNOSTIC_KNOWLEDGE[category]["ranges"].items():
-                if min_val <= cfg_value < max_val:
-                    explanation["reason"] = description
-                    break
-        except (ValueError, TypeError):
-            logger.warning(f"Invalid cfg_scale value: {setting_value}")
-
-        if level == DiagnosticLevel.DETAILED:
-            explanation["technical_notes"] = "Lower values = more creative, Higher values = more precise"
-        elif level == DiagnosticLevel.EXPERT:
-            explanation["technical_notes"] = "CFG controls prompt adherence vs. creativity"
-
-    elif category == SettingCategory.RESOLUTION:
-        resolution = str(setting_value)
-        try:
-            for aspect, (common_res, desc, note) in DIAGNOSTIC_KNOWLEDGE[category]["common_aspects"].items():
-                if resolution == common_res:
-                    explanation["reason"] = desc
-                    explanation["technical_notes"] = note
-                    break
-            explanation["alternatives"] = [
-                f"{res}: {desc}" for _, (res, desc, _) in DIAGNOSTIC_KNOWLEDGE[category]["common_aspects"].items()
-            ]
-        except Exception as e:
-            logger.warning(f"Resolution analysis failed: {e}")
-
-    elif category == SettingCategory.STEPS:
-        try:
-            steps = int(setting_value)
-            if steps < 20:
-                explanation["reason"] = "Fast generation, suitable for quick iterations"
-            elif steps < 40:
-                explanation["reason"] = "Balanced quality and speed, good for most purposes"
-            else:
-                explanation["reason"] = "High quality generation, best for final renders"
-            explanation["technical_notes"] = "More steps = better quality but slower generation"
-        except (ValueError, TypeError):
-            logger.warning(f"Invalid steps value: {setting_value}")
-
-    elif category == SettingCategory.DENOISE:
-        try:
-            denoise = float(setting_value)
-            if denoise < 0.3:
-                explanation["reason"] = "Minimal changes, preserves original structure"
-            elif denoise < 0.6:
-                explanation["reason"] = "Balanced transformation, good for most edits"
-            else:
-                explanation["reason"] = "Significant transformation, creative reinterpretation"
-            explanation["technical_notes"] = "Controls how much the image is changed (0.0-1.0)"
-        except (ValueError, TypeError):
-            logger.warning(f"Invalid denoise value: {setting_value}")
+    explainer = _EXPLAINERS.get(category)
+    if explainer:
+        explainer(setting_value, level, explanation, rng)
 
     return explanation
 
 
+def _explain_sampler(
+    value: Any, level: DiagnosticLevel, explanation: Dict[str, Any], rng
+) -> None:
+    sampler_info = _SAMPLER_KNOWLEDGE.get(value)
+    if sampler_info:
+        explanation["reason"] = f"Selected for {rng.choice(sampler_info.strengths)}"
+        if level is not DiagnosticLevel.BASIC:
+            explanation["alternatives"] = list(_SAMPLER_ALTERNATIVES[value])
+        explanation["technical_notes"] = sampler_info.recommendation
+
+
+def _to_float(value: Any) -> Tuple[bool, float]:
+    """Convert a numeric setting, returning (ok, value) instead of raising."""
+    if isinstance(value, (int, float)):
+        return True, float(value)
+    if isinstance(value, str):
+        try:
+            return True, float(value)
+        except ValueError:
+            pass
+    return False, 0.0
+
+
+def _explain_cfg(
+    value: Any, level: DiagnosticLevel, explanation: Dict[str, Any], rng
+) -> None:
+    ok, cfg_value = _to_float(value)
+    if ok:
+        index = bisect_right(_CFG_BOUNDS, cfg_value) - 1
+        if 0 <= index < len(_CFG_DESCRIPTIONS):
+            explanation["reason"] = _CFG_DESCRIPTIONS[index]
+    else:
+        logger.warning(f"Invalid cfg_scale value: {value}")
+
+    if level == DiagnosticLevel.DETAILED:
+        explanation["technical_notes"] = (
+            "Lower values = more creative, Higher values = more precise"
+        )
+    elif level == DiagnosticLevel.EXPERT:
+        explanation["technical_notes"] = "CFG controls prompt adherence vs. creativity"
+
+
+def _explain_resolution(
+    value: Any, level: DiagnosticLevel, explanation: Dict[str, Any], rng
+) -> None:
+    match = _RES_BY_STRING.get(str(value))
+    if match:
+        explanation["reason"], explanation["technical_notes"] = match[1], match[2]
+    if level is not DiagnosticLevel.BASIC:
+        explanation["alternatives"] = list(_RESOLUTION_ALTERNATIVES)
+
+
+def _explain_steps(
+    value: Any, level: DiagnosticLevel, explanation: Dict[str, Any], rng
+) -> None:
+    ok, steps = _to_float(value)
+    if not ok:
+        logger.warning(f"Invalid steps value: {value}")
+        return
+    explanation["reason"] = _STEPS_REASONS[bisect_right(_STEPS_THRESHOLDS, steps)]
+    explanation["technical_notes"] = "More steps = better quality but slower generation"
+
+
+def _explain_denoise(
+    value: Any, level: DiagnosticLevel, explanation: Dict[str, Any], rng
+) -> None:
+    ok, denoise = _to_float(value)
+    if not ok:
+        logger.warning(f"Invalid denoise value: {value}")
+        return
+    explanation["reason"] = _DENOISE_REASONS[bisect_right(_DENOISE_THRESHOLDS, denoise)]
+    explanation["technical_notes"] = "Controls how much the image is changed (0.0-1.0)"
+
+
+_EXPLAINERS: Dict[SettingCategory, Callable[..., None]] = {
+    SettingCategory.SAMPLER: _explain_sampler,
+    SettingCategory.CFG: _explain_cfg,
+    SettingCategory.RESOLUTION: _explain_resolution,
+    SettingCategory.STEPS: _explain_steps,
+    SettingCategory.DENOISE: _explain_denoise,
+}
+
+
 def _analyze_resources(resources: List[Dict[str, Any]]) -> Dict[str, Any]:
     """Summarize resources used in the package."""
+    by_type = Counter()
+    notable = []
+    for resource in resources:
+        by_type[resource.get("type", "unknown")] += 1
+        if resource.get("status") != "Verified":
+            notable.append(resource.get("name"))
     return {
         "total": len(resources),
-        "by_type": {r.get("type", "unknown"): 0 for r in resources},
-        "notable_resources": [r.get("name") for r in resources if r.get("status") != "Verified"]
+        "by_type": dict(by_type),
+        "notable_resources": notable
     }
 
 
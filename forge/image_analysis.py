@@ -1,13 +1,32 @@
 # forge/image_analysis.py
 import requests
+from requests.adapters import HTTPAdapter
 import time
 import os
+import ipaddress
+import socket
+import random
+import re
 import base64
 import logging
-from typing import Union, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Union, Dict, Any, List, Optional
+from urllib.parse import urljoin, urlsplit
 
 logger = logging.getLogger(__name__)
 
+# orjson decodes response bodies considerably faster when it is installed
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+
+def _parse_json(response: requests.Response) -> Any:
+    return _json.loads(response.content)
+
+
 # Config
 HF_TOKEN = os.getenv("HF_TOKEN")
 HEADERS = {"Authorization": f"Bearer {HF_TOKEN}"} if HF_TOKEN else {}
@@ -21,11 +40,46 @@ MODELS = {
 DEFAULT_RETRY_DELAY = 30
 MAX_RETRIES = 3
 
-STOPWORDS = {"the", "and", "with", "this", "that", "for", "from", "into", "onto", "very"}
+# Shared session so repeated inference calls reuse TCP/TLS connections. Retries live
+# only in query_hf's loop; the adapter must not retry underneath it
+_SESSION = requests.Session()
+_SESSION.headers.update(HEADERS)
+_SESSION.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=0))
+
+_OCTET_STREAM = {"Content-Type": "application/octet-stream"}
+
+# Remote images are downloaded in chunks and rejected past this size
+_MAX_IMAGE_BYTES = 10 << 20
+_DOWNLOAD_CHUNK = 64 << 10
+# Redirects are followed by hand so every hop's address is checked again
+_MAX_IMAGE_REDIRECTS = 3
+
+# Images up to this size keep their base64 encoding cached between calls
+_ENCODE_CACHE_MAX_BYTES = 1 << 20
+
+STOPWORDS = frozenset({"the", "and", "with", "this", "that", "for", "from", "into", "onto", "very"})
+_TAG_RE = re.compile(r"[a-z]{3,}")
+
+
+def _retry_wait(attempt: int, hint: Optional[float] = None) -> float:
+    """Capped exponential backoff with jitter; a server hint replaces the exponential step."""
+    return min(hint if hint else 2 ** attempt, DEFAULT_RETRY_DELAY) + random.uniform(0, 1)
+
+
+def _retry_after(response: Optional[requests.Response]) -> Optional[float]:
+    """Seconds from a Retry-After header given as a number, if the response has one."""
+    value = response.headers.get("Retry-After") if response is not None else None
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None  # HTTP-date form; fall back to exponential backoff
 
 
-def query_hf(model_id: str, payload: dict) -> Any:
-    """Send request to Hugging Face model with retry logic for cold starts."""
+def query_hf(model_id: str, payload: Union[dict, bytes]) -> Any:
+    """Send request to Hugging Face model with retry logic for cold starts.
+
+    A dict payload is sent as JSON; raw bytes are uploaded as the request body.
+    """
     if not HF_TOKEN:
         raise RuntimeError("HF_TOKEN not configured. Set environment variable.")
 
@@ -33,15 +87,21 @@ def query_hf(model_id: str, payload: dict) -> Any:
 
     for attempt in range(1, MAX_RETRIES + 1):
         try:
-            response = requests.post(url, headers=HEADERS, json=payload, timeout=120)
+            if isinstance(payload, bytes):
+                response = _SESSION.post(url, data=payload, headers=_OCTET_STREAM, timeout=120)
+            else:
+                response = _SESSION.post(url, json=payload, timeout=120)
             response.raise_for_status()
-            result = response.json()
+            result = _parse_json(response)
 
             if isinstance(result, dict) and "error" in result:
                 error_msg = result["error"].lower()
                 if "loading" in error_msg or "not found" in error_msg:
-                    wait = result.get("estimated_time", DEFAULT_RETRY_DELAY)
-                    logger.info(f"{model_id} loading... retry in {wait}s (attempt {attempt}/{MAX_RETRIES})")
+                    wait = _retry_wait(attempt, result.get("estimated_time"))
+                    logger.info(
+                        f"{model_id} loading... retry in {wait:.1f}s "
+                        f"(attempt {attempt}/{MAX_RETRIES})"
+                    )
                     time.sleep(wait)
                     continue
                 raise RuntimeError(f"Hugging Face API error: {result['error']}")
@@ -52,21 +112,80 @@ def query_hf(model_id: str, payload: dict) -> Any:
             logger.warning(f"Request failed (attempt {attempt}/{MAX_RETRIES}): {e}")
             if attempt == MAX_RETRIES:
                 raise
-            time.sleep(DEFAULT_RETRY_DELAY)
+            time.sleep(_retry_wait(attempt, _retry_after(e.response)))
         except Exception as e:
             logger.error(f"Unexpected error (attempt {attempt}/{MAX_RETRIES}): {e}")
             if attempt == MAX_RETRIES:
                 raise
-            time.sleep(DEFAULT_RETRY_DELAY)
+            time.sleep(_retry_wait(attempt))
 
     raise RuntimeError(f"{model_id} did not respond after {MAX_RETRIES} retries")
 
 
+@lru_cache(maxsize=16)
+def _encode_cached(data: bytes) -> str:
+    return base64.b64encode(data).decode("utf-8")
+
+
+def _encode_image(data: Union[bytes, bytearray]) -> str:
+    """Base64-encode image bytes, reusing the result for recently seen small images."""
+    data = bytes(data)
+    if len(data) <= _ENCODE_CACHE_MAX_BYTES:
+        return _encode_cached(data)
+    return base64.b64encode(data).decode("utf-8")
+
+
+def _check_public_url(url: str) -> None:
+    """Reject URLs that are not http(s) or resolve to a non-public address (SSRF guard)."""
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https") or not parts.hostname:
+        raise ValueError(f"Unsupported image URL: {url}")
+    try:
+        port = parts.port or (443 if parts.scheme == "https" else 80)
+        infos = socket.getaddrinfo(parts.hostname, port, type=socket.SOCK_STREAM)
+    except (socket.gaierror, ValueError) as e:
+        raise ValueError(f"Cannot resolve image host '{parts.hostname}': {e}") from None
+    for info in infos:
+        address = ipaddress.ip_address(info[4][0].split("%", 1)[0])
+        mapped = getattr(address, "ipv4_mapped", None)
+        if mapped is not None:
+            address = mapped
+        # is_global excludes loopback, private, link-local (incl. 169.254.169.254) and reserved
+        if not address.is_global or address.is_multicast:
+            raise ValueError(f"Image URL host '{parts.hostname}' is not a public address")
+
+
+def _fetch_image(url: str) -> bytes:
+    """Download a public image URL with a size cap so oversize inputs fail before the HF call."""
+    for _ in range(_MAX_IMAGE_REDIRECTS + 1):
+        _check_public_url(url)
+        # Drop the session's HF Authorization header; the token must not go to third-party hosts
+        with _SESSION.get(
+            url, headers={"Authorization": None}, stream=True, timeout=30, allow_redirects=False
+        ) as response:
+            if response.is_redirect:
+                url = urljoin(url, response.headers["Location"])
+                continue
+            response.raise_for_status()
+            declared = response.headers.get("Content-Length")
+            if declared and declared.isdigit() and int(declared) > _MAX_IMAGE_BYTES:
+                raise RuntimeError(f"Image at {url} is too large ({declared} bytes)")
+            buf = bytearray()
+            for chunk in response.iter_content(_DOWNLOAD_CHUNK):
+                buf += chunk
+                if len(buf) > _MAX_IMAGE_BYTES:
+                    raise RuntimeError(f"Image at {url} exceeds {_MAX_IMAGE_BYTES} bytes")
+        return bytes(buf)
+    raise RuntimeError(f"Image URL redirected more than {_MAX_IMAGE_REDIRECTS} times")
+
+
 def _clean_tags(description: str) -> list[str]:
     """Split a caption into cleaned keyword tags."""
-    words = [w.strip(".,").lower() for w in description.split()]
-    tags = [w for w in words if len(w) > 2 and w not in STOPWORDS]
-    return list(dict.fromkeys(tags))  # dedupe while preserving order
+    tags = {}  # dict keeps first-seen order while deduping
+    for word in _TAG_RE.findall(description.lower()):
+        if word not in STOPWORDS:
+            tags[word] = None
+    return list(tags)
 
 
 def analyse_image(
@@ -80,16 +199,15 @@ def analyse_image(
 
     model_id = MODELS[mode]
 
-    # Encode input
-    if isinstance(image_input, bytes):
-        image_data = base64.b64encode(image_input).decode("utf-8")
-    else:
-        image_data = image_input
+    if isinstance(image_input, str) and image_input.startswith(("http://", "https://")):
+        image_input = _fetch_image(image_input)
+    is_bytes = isinstance(image_input, (bytes, bytearray))
 
-    # Build payload
+    # Build payload; captioning models take raw image bytes directly, skipping base64
     if mode in {"basic", "tags"}:
-        payload = {"inputs": image_data}
+        payload = bytes(image_input) if is_bytes else {"inputs": image_input}
     else:
+        image_data = _encode_image(image_input) if is_bytes else image_input
         question = (
             "Describe this image in extreme detail. Include objects, colors, "
             "composition, style, mood, and any text visible."
@@ -131,6 +249,18 @@ def analyse_image_with_envelope(image_input: Union[str, bytes], mode: str = "bas
         return {"outcome": "error", "result": None, "message": f"Image analysis failed: {str(e)}"}
 
 
+def analyse_images(
+    inputs: List[Union[str, bytes]],
+    mode: str = "basic",
+    max_workers: int = 8
+) -> List[Dict[str, Any]]:
+    """Analyse several images concurrently, returning one envelope per input in order."""
+    if not inputs:
+        return []
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(inputs))) as executor:
+        return list(executor.map(lambda image: analyse_image_with_envelope(image, mode), inputs))
+
+
 def analyse_sealed(request: dict) -> Dict[str, Any]:
     """Sealed entrypoint for API route /v2/analyse."""
     image_url = request.get("image_url")
@@ -1,11 +1,33 @@
 import os
 import requests
+from requests.adapters import HTTPAdapter
 import logging
-from typing import Dict, List, Optional, Any
+import time
+from typing import Dict, List, Optional, Any, Tuple
 from enum import Enum
 
 logger = logging.getLogger(__name__)
 
+# Seconds a connection test result is reused before probing the service again
+CONNECTION_CHECK_TTL = 60.0
+
+# orjson decodes response bodies considerably faster when it is installed
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+
+def _parse_json(response: requests.Response) -> Any:
+    return _json.loads(response.content)
+
+
+def _build_session() -> requests.Session:
+    """Create a session with a bounded connection pool for one integration."""
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=0))
+    return session
+
 class IntegrationStatus(Enum):
     ACTIVE = "active"
     AVAILABLE = "available"
@@ -16,20 +38,38 @@ class IntegrationStatus(Enum):
 class Integration:
     """Base class for all integrations."""
 
+    __slots__ = ("name", "status", "base_url", "config", "_session", "_conn_cache")
+
     def __init__(self, name: str, status: IntegrationStatus, base_url: Optional[str] = None):
         self.name = name
         self.status = status
         self.base_url = base_url
         self.config: Dict[str, Any] = {}
+        self._session = _build_session()
+        # (token hash, monotonic timestamp, result) of the last connection test
+        self._conn_cache: Optional[Tuple[int, float, bool]] = None
 
     def configure(self, **kwargs):
         """Configure integration with API keys or settings."""
         self.config.update(kwargs)
+        if kwargs.get("api_token"):
+            self._session.headers["Authorization"] = f"Bearer {kwargs['api_token']}"
         return self
 
     def test_connection(self) -> bool:
-        """Test if integration is working."""
-        raise NotImplementedError("Subclasses must implement test_connection")
+        """Test if integration is working, reusing a result from the last minute."""
+        key = hash(self.config.get("api_token"))
+        now = time.monotonic()
+        if self._conn_cache is not None:
+            cached_key, checked_at, ok = self._conn_cache
+            if cached_key == key and now - checked_at < CONNECTION_CHECK_TTL:
+                return ok
+        ok = self._check_connection()
+        self._conn_cache = (key, now, ok)
+        return ok
+
+    def _check_connection(self) -> bool:
+        raise NotImplementedError("Subclasses must implement _check_connection")
 
     def get_status(self) -> Dict[str, Any]:
         """Get detailed status of integration."""
@@ -41,6 +81,8 @@ class Integration:
         }
 
 class HuggingFaceIntegration(Integration):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="huggingface",
@@ -48,29 +90,28 @@ class HuggingFaceIntegration(Integration):
             base_url="https://api-inference.huggingface.co"
         )
 
-    def test_connection(self) -> bool:
+    def _check_connection(self) -> bool:
         if not self.config.get("api_token"):
             return False
         try:
-            headers = {"Authorization": f"Bearer {self.config['api_token']}"}
-            response = requests.get(f"{self.base_url}/models", headers=headers, timeout=10)
+            response = self._session.get(f"{self.base_url}/models", timeout=10)
             return response.status_code == 200
         except Exception as e:
             logger.warning(f"HuggingFace connection failed: {e}")
             return False
 
     def query_model(self, model_id: str, payload: dict) -> Any:
-        headers = {"Authorization": f"Bearer {self.config.get('api_token', '')}"}
-        response = requests.post(
+        response = self._session.post(
             f"{self.base_url}/models/{model_id}",
-            headers=headers,
             json=payload,
             timeout=30
         )
         response.raise_for_status()
-        return response.json()
+        return _parse_json(response)
 
 class CivitAIIntegration(Integration):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="civitai",
@@ -78,9 +119,9 @@ class CivitAIIntegration(Integration):
             base_url="https://civitai.com/api/v1"
         )
 
-    def test_connection(self) -> bool:
+    def _check_connection(self) -> bool:
         try:
-            response = requests.get(f"{self.base_url}/models", timeout=10)
+            response = self._session.get(f"{self.base_url}/models", timeout=10)
             return response.status_code == 200
         except Exception as e:
             logger.warning(f"CivitAI connection failed: {e}")
@@ -89,17 +130,20 @@ class CivitAIIntegration(Integration):
     def search_models(self, query: str, limit: int = 10) -> List[Dict]:
         try:
             params = {"query": query, "limit": limit}
-            response = requests.get(f"{self.base_url}/models", params=params, timeout=15)
+            response = self._session.get(f"{self.base_url}/models", params=params, timeout=15)
             response.raise_for_status()
-            return response.json().get("items", [])
+            return _parse_json(response).get("items", [])
         except Exception as e:
             logger.error(f"CivitAI search failed: {str(e)}")
             return []
 
-def list_integrations() -> List[str]:
-    """List all available integrations."""
-    integrations = [HuggingFaceIntegration(), CivitAIIntegration()]
-    active_integrations = [
-        integration.name for integration in integrations if integration.status == IntegrationStatus.ACTIVE
+
+_INTEGRATIONS: Tuple[Integration, ...] = (HuggingFaceIntegration(), CivitAIIntegration())
+
+
+def list_integrations(active_only: bool = True) -> List[str]:
+    """List integration names, by default only those currently active."""
+    return [
+        integration.name for integration in _INTEGRATIONS
+        if not active_only or integration.status is IntegrationStatus.ACTIVE
     ]
-    return active_integrations
@@ -1,18 +1,21 @@
 # forge/optimizer.py — Sealed Package Orchestrator 🔒
 
 import logging
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
 
 from forge.safety import safety_scrub
 from forge.prompts import build_prompts, analyze_prompt_style
-from forge.config import settings   # ✅ using config instead of missing settings.py
+from forge.settings import build_settings, get_menus
 from forge.resources import validate_resources
 from forge.captions import generate_captions
-from forge.comfy_patches import generate_workflow_patch
+from forge.comfy_patches import cached_workflow_patch
 from forge.profiles import load_profile, adapt_settings, adapt_captions
 
 logger = logging.getLogger(__name__)
 
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
 
 def optimise_sealed(request: Dict[str, Any]) -> Dict[str, Any]:
     """🔒 SEALED: Orchestrates Forge modules to produce a sealed prompt package."""
@@ -22,22 +25,20 @@ def optimise_sealed(request: Dict[str, Any]) -> Dict[str, Any]:
         user_profile = request.get("profile") or load_profile("default")
 
         # 2. Safety filtering
-        allow_nsfw = user_profile.get("content_preferences", {}).get("allow_nsfw", False)
+        prefs = user_profile.get("content_preferences") or _EMPTY
+        allow_nsfw = prefs.get("allow_nsfw", False)
         cleaned_prompt = safety_scrub(request.get("prompt", ""), allow_nsfw=allow_nsfw)
-        logger.debug(f"Prompt scrubbed → {cleaned_prompt[:80]}...")
+        logger.debug("Prompt scrubbed → %.80s...", cleaned_prompt)
 
         # 3. Intent analysis
         intent = analyze_prompt_style(cleaned_prompt)
-        logger.debug(f"Prompt intent → {intent}")
+        logger.debug("Prompt intent → %s", intent)
 
         # 4. Prompt generation
         positive, negative = build_prompts(cleaned_prompt, user_profile)
 
         # 5. Config generation + adapt via profile
-        base_settings = adapt_settings(
-            build_settings(request["package_goal"], intent), 
-            user_profile
-        )
+        base_settings = adapt_settings(build_settings(request["package_goal"]), user_profile)
 
         # 6. Resource filtering
         resources = validate_resources(request.get("resources", []))
@@ -49,7 +50,7 @@ def optimise_sealed(request: Dict[str, Any]) -> Dict[str, Any]:
         )
 
         # 8. Workflow patch
-        workflow_patch = generate_workflow_patch(base_settings)
+        workflow_patch = cached_workflow_patch(base_settings)
 
         # 9. Final package
         return {
@@ -63,10 +64,10 @@ def optimise_sealed(request: Dict[str, Any]) -> Dict[str, Any]:
                 "nsfw_allowed": allow_nsfw,
                 "resources": resources,
             },
-            "menus": _get_menus(request["package_goal"]),
+            "menus": get_menus(request["package_goal"]),
             "package_goal": request["package_goal"],
             "captions": captions,
-            "profile_used": user_profile.get("metadata", {}),
+            "profile_used": dict(user_profile.get("metadata", {})),
         }
 
     except Exception as e:
@@ -76,18 +77,3 @@ def optimise_sealed(request: Dict[str, Any]) -> Dict[str, Any]:
             "outcome": "error",
             "message": f"Forge optimisation failed: {str(e)}"
         }
-
-
-def _get_menus(package_goal: str) -> list:
-    """Get appropriate menus for the package goal."""
-    base_menus = [
-        "variants", "prompt", "negatives", "config", "workflow",
-        "safety", "version", "rationale", "discard", "help",
-    ]
-
-    if package_goal in ["i2i", "i2v"]:
-        base_menus.append("denoise")
-    if package_goal in ["t2v", "i2v"]:
-        base_menus.extend(["frames", "motion"])
-
-    return base_menus
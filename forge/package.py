@@ -1,24 +1,41 @@
 # forge/package.py
+import threading
 import time
 import logging
-from datetime import datetime, timezone
-from typing import Dict, List, Optional, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from functools import lru_cache
+from itertools import islice
 
 # Forge modules
 from forge.prompts import build_prompts
-from forge.settings import build_settings
+from forge.settings import build_settings, get_menus
 from forge.resources import validate_resources
 from forge.captions import generate_captions
 from forge.diagnostics import generate_diagnostics, DiagnosticLevel
 from forge.benchmarking import run_benchmarks
-from forge.profiles import load_profile, adapt_settings, adapt_captions
+from forge.profiles import (
+    load_profile, adapt_settings, adapt_captions, profile_to_dict, utc_isoformat_ns
+)
 from forge.integrations import list_integrations
-from forge.comfy_patches import generate_workflow_patch
+from forge.comfy_patches import cached_workflow_patch
 from forge.safety import safety_scrub, build_safety
 
 logger = logging.getLogger(__name__)
 
+_VALID_GOALS = frozenset({"t2i", "t2v", "i2i", "i2v", "upscale", "interrogate"})
+
+# Shared by all requests for the package steps that do not depend on each other
+_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="forge-package")
+
+# Benchmarks and the integration list barely change between requests, so reuse them briefly
+BENCHMARKS_TTL = 60.0
+INTEGRATIONS_TTL = 30.0
+
+# key -> (monotonic timestamp, value)
+_ttl_cache: Dict[str, Tuple[float, Any]] = {}
+_ttl_lock = threading.Lock()
+
 
 def build_package(
     package_goal: str,
@@ -36,35 +53,40 @@ def build_package(
     Returns a dictionary aligned with ForgePromptPackage contract.
     """
 
-    logger.info(f"Building package for user '{user_id}' with goal '{package_goal}'")
+    logger.info("Building package for user '%s' with goal '%s'", user_id, package_goal)
     _validate_package_goal(package_goal)
 
     # Step 1: Clean + profile
     cleaned_prompt = safety_scrub(prompt, allow_nsfw=allow_nsfw)
     resources = resources or []
     profile = load_profile(user_id)
-    start_time = time.time()
+    start_ns = time.time_ns()
+    start_time = time.perf_counter()
 
     # Step 2: Prompt enrichment
     enriched_prompt = _enrich_prompt_with_descriptors(cleaned_prompt, descriptors)
 
     try:
+        # Independent steps run on the shared pool while the core builders run here
+        resources_future = _EXECUTOR.submit(validate_resources, resources)
+        captions_future = _EXECUTOR.submit(generate_captions, enriched_prompt, caption, profile)
+        benchmarks_future = _EXECUTOR.submit(_cached_benchmarks) if include_benchmarks else None
+        integrations_future = _EXECUTOR.submit(_cached_integrations)
+
         # Step 3: Core builders
         pos_prompt, neg_prompt = build_prompts(enriched_prompt, profile)
-        settings = build_settings(profile, package_goal)
-        settings = adapt_settings(settings, profile)
-        validated_resources = validate_resources(resources)
+        settings = adapt_settings(build_settings(package_goal), profile)
+        validated_resources = resources_future.result()
 
         # Step 4: Captions + adaptation
-        captions = generate_captions(enriched_prompt, caption, profile)
-        captions = adapt_captions(captions, profile)
+        captions = adapt_captions(captions_future.result(), profile)
 
         # Step 5: Diagnostics
         diagnostics = generate_diagnostics(settings, validated_resources, diagnostics_level)
 
         # Step 6: Benchmarks & integrations
-        benchmarks = run_benchmarks() if include_benchmarks else {}
-        integrations = list_integrations(active_only=True)
+        benchmarks = benchmarks_future.result() if benchmarks_future else {}
+        integrations = integrations_future.result()
 
     except Exception as e:
         logger.exception("Package construction failed")
@@ -75,18 +97,18 @@ def build_package(
         }
 
     # Step 7: Final package assembly
-    build_time = round(time.time() - start_time, 4)
-    package_id = f"forge_pkg_{int(start_time)}"
-    timestamp = datetime.now(timezone.utc).isoformat()
+    build_time = round(time.perf_counter() - start_time, 4)
+    package_id = f"forge_pkg_{start_ns // 1_000_000_000}"
+    timestamp = utc_isoformat_ns(time.time_ns())
 
     package = {
         "package_version": "v1.0",
         "positive": pos_prompt,
         "negative": neg_prompt,
         "config": settings,
-        "workflow_patch": generate_workflow_patch(settings),
+        "workflow_patch": cached_workflow_patch(settings),
         "safety": build_safety(validated_resources, nsfw_allowed=allow_nsfw),
-        "menus": _get_menus(package_goal),
+        "menus": get_menus(package_goal),
         "package_goal": package_goal,
         # audit / extras
         "id": package_id,
@@ -95,7 +117,7 @@ def build_package(
         "diagnostics": {**diagnostics, "build_time": build_time},
         "benchmarks": benchmarks,
         "integrations": integrations,
-        "profile_used": profile,
+        "profile_used": profile_to_dict(profile),
         "captions": captions,
     }
 
@@ -107,55 +129,67 @@ def build_package(
     if metadata:
         package["metadata"] = metadata
 
-    logger.info(f"Package {package_id} built successfully in {build_time}s (goal={package_goal})")
+    logger.info(
+        "Package %s built successfully in %ss (goal=%s)", package_id, build_time, package_goal
+    )
     return package
 
 
+def clear_package_caches() -> None:
+    """Drop cached benchmarks and integrations, e.g. after a config reload."""
+    with _ttl_lock:
+        _ttl_cache.clear()
+
+
 # --- Helpers ---
 
-@lru_cache(maxsize=32)
-def _validate_package_goal(goal: str):
-    valid_goals = {"t2i", "t2v", "i2i", "i2v", "upscale", "interrogate"}
-    if goal not in valid_goals:
-        raise ValueError(f"Unsupported package goal: '{goal}'. Must be one of: {sorted(valid_goals)}")
+def _ttl_cached(key: str, ttl: float, compute: Callable[[], Any]) -> Any:
+    now = time.monotonic()
+    with _ttl_lock:
+        entry = _ttl_cache.get(key)
+    if entry is not None and now - entry[0] < ttl:
+        return entry[1]
+    value = compute()
+    with _ttl_lock:
+        _ttl_cache[key] = (now, value)
+    return value
+
+
+def _cached_benchmarks() -> Dict[str, Any]:
+    return dict(_ttl_cached("benchmarks", BENCHMARKS_TTL, run_benchmarks))
+
+
+def _cached_integrations() -> List[str]:
+    active = _ttl_cached("integrations", INTEGRATIONS_TTL, list_integrations)
+    return list(active)
+
+
+def _validate_package_goal(goal: str) -> None:
+    if goal not in _VALID_GOALS:
+        raise ValueError(
+            f"Unsupported package goal: '{goal}'. Must be one of: {sorted(_VALID_GOALS)}"
+        )
 
 
 def _enrich_prompt_with_descriptors(base_prompt: str, descriptors: Optional[Dict[str, Any]]) -> str:
     if not descriptors:
         return base_prompt
 
-    subject = descriptors.get("subject", "").strip()
-    style = descriptors.get("style", "").strip()
-    tags = descriptors.get("tags", [])
-    prompt_lower = base_prompt.lower()
-    new_elements = []
+    return _enrich_prompt(
+        base_prompt,
+        descriptors.get("subject", "").strip(),
+        descriptors.get("style", "").strip(),
+        tuple(descriptors.get("tags", ())),
+    )
 
-    if subject and subject.lower() not in prompt_lower:
-        new_elements.append(subject)
-    if style and style.lower() not in prompt_lower:
-        new_elements.append(style)
-    relevant_tags = [tag for tag in tags if tag.lower() not in prompt_lower][:3]
+
+@lru_cache(maxsize=512)
+def _enrich_prompt(base_prompt: str, subject: str, style: str, tags: Tuple[str, ...]) -> str:
+    prompt_lower = base_prompt.lower()
+    new_elements = [term for term in (subject, style) if term and term.lower() not in prompt_lower]
+    # Stop scanning tags once three new ones are found
+    relevant_tags = list(islice((tag for tag in tags if tag.lower() not in prompt_lower), 3))
     if relevant_tags:
         new_elements.append(", ".join(relevant_tags))
 
     return f"{base_prompt}, {', '.join(new_elements)}" if new_elements else base_prompt
-
-
-def _get_menus(package_goal: str) -> List[str]:
-    base_menus = [
-        "variants",
-        "prompt",
-        "negatives",
-        "config",
-        "workflow",
-        "safety",
-        "version",
-        "rationale",
-        "discard",
-        "help",
-    ]
-    if package_goal in ["i2i", "i2v"]:
-        base_menus.append("denoise")
-    if package_goal in ["t2v", "i2v"]:
-        base_menus.extend(["frames", "motion"])
-    return base_menus
@@ -1,14 +1,38 @@
 # forge/profiles.py
+import atexit
 import json
 import os
-from typing import Dict, Any, Optional, List
+import queue
+import threading
+import time
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple
 from pathlib import Path
 import logging
 from enum import Enum
-from datetime import datetime, timezone
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
+# orjson is much faster at (de)serialising profiles when it is installed
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        try:
+            # Non-str keys are converted the way json.dumps converts them
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # Anything else orjson rejects (e.g. ints beyond 64 bits) goes to json
+            return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    _loads = json.loads
+
 
 class VerbosityLevel(Enum):
     COMPACT = "compact"
@@ -30,6 +54,16 @@ class CheckpointPreference(Enum):
     CUSTOM = "custom"
 
 
+# Plain string values for the hot paths, so enum members are not resolved per call
+_VL_NORMAL = VerbosityLevel.NORMAL.value
+_VL_VERBOSE = VerbosityLevel.VERBOSE.value
+_VL_COMPACT = VerbosityLevel.COMPACT.value
+_CS_BALANCED = CaptionStyle.BALANCED.value
+_CS_TECHNICAL = CaptionStyle.TECHNICAL.value
+_CS_NARRATIVE = CaptionStyle.NARRATIVE.value
+_CS_ACCESSIBILITY = CaptionStyle.ACCESSIBILITY.value
+
+
 DEFAULT_PROFILE = {
     "verbosity": VerbosityLevel.NORMAL.value,
     "caption_style": CaptionStyle.BALANCED.value,
@@ -50,66 +84,218 @@ DEFAULT_PROFILE = {
         "preferred_aspect_ratios": ["16:9", "1:1", "9:16"],
         "max_output_size": "1024x1024",
     },
+    # Timestamps are filled in when the profile is first saved
     "metadata": {
-        "created": datetime.now(timezone.utc).isoformat(),
-        "last_modified": datetime.now(timezone.utc).isoformat(),
+        "created": None,
+        "last_modified": None,
         "usage_count": 0,
     },
 }
 
-_profile_store: Dict[str, Dict[str, Any]] = {"default": DEFAULT_PROFILE.copy()}
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts to read-only mappings and lists to tuples."""
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def profile_to_dict(profile: Mapping[str, Any]) -> Dict[str, Any]:
+    """Return a mutable deep copy of a (possibly frozen) profile."""
+    def thaw(value: Any) -> Any:
+        if isinstance(value, Mapping):
+            return {key: thaw(item) for key, item in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [thaw(item) for item in value]
+        return value
+    return thaw(profile)
+
+
+# Shared read-only baseline; nested sections cannot be mutated through any caller
+_FROZEN_DEFAULT: Mapping[str, Any] = _freeze(DEFAULT_PROFILE)
+
+# Only the default profile is held in process; user profiles are read from disk
+# through the bounded _read_profile cache below. Stored profiles are frozen.
+_profile_store: Dict[str, Mapping[str, Any]] = {"default": _FROZEN_DEFAULT}
 PROFILES_DIR = Path(os.getenv("FORGE_PROFILES_DIR", "./profiles"))
 
 
+def utc_isoformat_ns(ns: int) -> str:
+    """Format a time.time_ns() value as an ISO 8601 UTC timestamp with microseconds."""
+    seconds, remainder = divmod(ns, 1_000_000_000)
+    return f"{time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(seconds))}.{remainder // 1000:06d}Z"
+
+
+_profiles_dir_ready = False
+# Ids with a file in PROFILES_DIR, listed once and then kept in step by this
+# process's writes and deletes; files added by other processes are not seen
+_saved_ids: Optional[Set[str]] = None
+
+
 def _ensure_profiles_dir():
+    global _profiles_dir_ready
+    if _profiles_dir_ready:
+        return
     PROFILES_DIR.mkdir(exist_ok=True, parents=True)
+    _profiles_dir_ready = True
+
+
+def _saved_profile_ids() -> Set[str]:
+    global _saved_ids
+    if _saved_ids is None:
+        with _pending_lock:
+            if _saved_ids is None:
+                _saved_ids = {p.stem for p in PROFILES_DIR.glob("*.json")}
+    return _saved_ids
+
+
+def _profile_path(user_id: str) -> Path:
+    return PROFILES_DIR / f"{user_id}.json"
+
+
+@lru_cache(maxsize=1024)
+def _read_profile(user_id: str, mtime_ns: int, size: int) -> Mapping[str, Any]:
+    """Parse a profile file; the stat fields in the key drop stale entries after a write."""
+    profile = _loads(_profile_path(user_id).read_bytes())
+    logger.info(f"Loaded profile for user '{user_id}' from disk")
+    return _freeze(profile)
 
 
-def load_profile(user_id: str = "default") -> Dict[str, Any]:
-    """Load profile from memory or disk."""
+# --- Background persistence ---
+# save_profile serialises the latest version per user into _pending and queues
+# the user id; a single writer thread persists it, so repeated saves for one user
+# collapse into one write. Reads see pending versions before they reach disk.
+# An entry only leaves _pending once its write succeeded; failed writes are
+# retried and, if they keep failing, the data stays pending for the next save or flush.
+_pending: Dict[str, Tuple[bytes, Mapping[str, Any]]] = {}
+_pending_lock = threading.Lock()
+_write_queue: "queue.Queue[str]" = queue.Queue()
+_writer: Optional[threading.Thread] = None
+# Seconds to wait before each retry of a failed profile write
+_WRITE_RETRY_DELAYS = (0.1, 0.5, 2.0)
+
+
+def _write_profile_file(user_id: str, payload: bytes) -> None:
+    _ensure_profiles_dir()
+    tmp_path = PROFILES_DIR / f"{user_id}.json.tmp"
+    tmp_path.write_bytes(payload)
+    os.replace(tmp_path, _profile_path(user_id))
+    saved = _saved_profile_ids()
+    with _pending_lock:
+        saved.add(user_id)
+
+
+def _writer_loop() -> None:
+    while True:
+        user_id = _write_queue.get()
+        try:
+            with _pending_lock:
+                entry = _pending.get(user_id)
+            if entry is None:
+                continue  # already written by an earlier queue entry
+            if not _write_with_retries(user_id, entry[0]):
+                continue  # keep the entry pending; the next save or flush retries it
+            logger.info(f"Saved profile for user '{user_id}'")
+            with _pending_lock:
+                # Keep the entry if a newer save arrived during the write
+                if _pending.get(user_id) is entry:
+                    del _pending[user_id]
+        finally:
+            _write_queue.task_done()
+
+
+def _write_with_retries(user_id: str, payload: bytes) -> bool:
+    for delay in (*_WRITE_RETRY_DELAYS, None):
+        try:
+            _write_profile_file(user_id, payload)
+            return True
+        except Exception as e:
+            if delay is None:
+                logger.error(
+                    f"Failed to save profile for '{user_id}'; keeping it in memory: {e}",
+                    exc_info=True,
+                )
+                return False
+            logger.warning(f"Retrying profile save for '{user_id}' in {delay}s: {e}")
+            time.sleep(delay)
+    return False
+
+
+def _ensure_writer() -> None:
+    global _writer
+    with _pending_lock:
+        if _writer is None:
+            _writer = threading.Thread(
+                target=_writer_loop, name="forge-profile-writer", daemon=True
+            )
+            _writer.start()
+
+
+def flush_profiles() -> None:
+    """Block until every pending profile save has been written to disk or given up on."""
+    with _pending_lock:
+        stuck = list(_pending)
+    if stuck:
+        # Queue everything still pending, so saves that failed earlier get another try
+        _ensure_writer()
+        for user_id in stuck:
+            _write_queue.put(user_id)
+    _write_queue.join()
+
+
+atexit.register(flush_profiles)
+
+
+def load_profile(user_id: str = "default") -> Mapping[str, Any]:
+    """Load profile from memory or disk as a read-only view; use profile_to_dict to edit."""
     if user_id in _profile_store:
-        return _profile_store[user_id].copy()
+        return _profile_store[user_id]
+    pending = _pending.get(user_id)
+    if pending is not None:
+        return pending[1]
 
-    profile_path = PROFILES_DIR / f"{user_id}.json"
-    if profile_path.exists():
+    try:
+        stat = os.stat(_profile_path(user_id))
+    except FileNotFoundError:
+        stat = None
+    if stat is not None:
         try:
-            with open(profile_path, "r") as f:
-                profile = json.load(f)
-            _profile_store[user_id] = profile
-            logger.info(f"Loaded profile for user '{user_id}' from disk")
-            return profile.copy()
+            return _read_profile(user_id, stat.st_mtime_ns, stat.st_size)
         except Exception as e:
             logger.warning(f"Failed to load profile for '{user_id}': {e}", exc_info=True)
 
     logger.info(f"Using default profile for user '{user_id}'")
-    return DEFAULT_PROFILE.copy()
+    return _FROZEN_DEFAULT
 
 
-def save_profile(user_id: str, profile: Dict[str, Any]) -> bool:
-    """Save profile to disk and memory."""
+def save_profile(user_id: str, profile: Mapping[str, Any]) -> bool:
+    """Save profile to memory and queue it for writing to disk (see flush_profiles)."""
     try:
-        _ensure_profiles_dir()
-        profile_path = PROFILES_DIR / f"{user_id}.json"
-
         meta = profile.get("metadata", {})
-        now = datetime.now(timezone.utc).isoformat()
+        now = utc_isoformat_ns(time.time_ns())
 
         # Preserve creation date if present
-        created = meta.get("created", now)
+        created = meta.get("created") or now
         usage_count = meta.get("usage_count", 0) + 1
 
-        profile_with_meta = profile.copy()
+        profile_with_meta = profile_to_dict(profile)
         profile_with_meta["metadata"] = {
             "created": created,
             "last_modified": now,
             "usage_count": usage_count,
         }
 
-        with open(profile_path, "w") as f:
-            json.dump(profile_with_meta, f, indent=2)
-
-        _profile_store[user_id] = profile_with_meta
-        logger.info(f"Saved profile for user '{user_id}'")
+        # Serialise here so unserialisable profiles fail the save instead of the writer
+        payload = _dumps(profile_with_meta)
+        frozen = _freeze(profile_with_meta)
+        if user_id == "default":
+            _profile_store[user_id] = frozen
+        with _pending_lock:
+            _pending[user_id] = (payload, frozen)
+        _ensure_writer()
+        _write_queue.put(user_id)
         return True
     except Exception as e:
         logger.error(f"Failed to save profile for '{user_id}': {e}", exc_info=True)
@@ -119,86 +305,109 @@ def save_profile(user_id: str, profile: Dict[str, Any]) -> bool:
 def update_profile(user_id: str = "default", updates: Optional[Dict[str, Any]] = None) -> bool:
     if not updates:
         return False
-    profile = load_profile(user_id)
+    profile = profile_to_dict(load_profile(user_id))
     profile.update(updates)
     return save_profile(user_id, profile)
 
 
 def create_profile(user_id: str, base_profile: Optional[Dict[str, Any]] = None) -> bool:
-    if user_id in _profile_store:
+    if user_id in _profile_store or user_id in _pending or _profile_path(user_id).exists():
         logger.warning(f"Profile already exists for user '{user_id}'")
         return False
-    profile = base_profile.copy() if base_profile else DEFAULT_PROFILE.copy()
-    return save_profile(user_id, profile)
+    # save_profile deep-copies, so the templates are never shared with the stored profile
+    return save_profile(user_id, base_profile or DEFAULT_PROFILE)
 
 
-def adapt_settings(settings: Dict[str, Any], profile: Dict[str, Any]) -> Dict[str, Any]:
+def adapt_settings(settings: Dict[str, Any], profile: Mapping[str, Any]) -> Dict[str, Any]:
     """Adjust generation settings according to profile."""
     settings = settings.copy()
+    if profile.get("preferred_checkpoint"):
+        settings["checkpoint"] = profile["preferred_checkpoint"]
+    if profile.get("preferred_sampler"):
+        settings["sampler"] = profile["preferred_sampler"]
+
+    steps = settings.get("steps", 20)
+    cfg_scale = settings.get("cfg_scale", 7.5)
 
-    verbosity = profile.get("verbosity", VerbosityLevel.NORMAL.value)
-    if verbosity == VerbosityLevel.VERBOSE.value:
-        settings["steps"] = settings.get("steps", 20) + 8
-    elif verbosity == VerbosityLevel.COMPACT.value:
-        settings["steps"] = max(15, settings.get("steps", 20) - 5)
+    verbosity = profile.get("verbosity", _VL_NORMAL)
+    if verbosity == _VL_VERBOSE:
+        steps += 8
+    elif verbosity == _VL_COMPACT:
+        steps = max(15, steps - 5)
 
     detected_style = settings.get("detected_style")
-    style_boost = profile.get("style_boost", {})
-    if detected_style and detected_style in style_boost:
-        boost = style_boost[detected_style]
-        settings["cfg_scale"] = settings.get("cfg_scale", 7.5) + boost.get("cfg_adjust", 0)
-        settings["steps"] = settings.get("steps", 20) + boost.get("steps_adjust", 0)
+    boost = profile.get("style_boost", {}).get(detected_style) if detected_style else None
+    if boost:
+        cfg_scale += boost.get("cfg_adjust", 0)
+        steps += boost.get("steps_adjust", 0)
 
-    caption_style = profile.get("caption_style", CaptionStyle.BALANCED.value)
-    if caption_style == CaptionStyle.TECHNICAL.value:
-        settings["cfg_scale"] = settings.get("cfg_scale", 7.5) + 0.7
+    if profile.get("caption_style", _CS_BALANCED) == _CS_TECHNICAL:
+        cfg_scale += 0.7
 
-    settings["cfg_scale"] = max(1.0, min(20.0, settings.get("cfg_scale", 7.5)))
-    settings["steps"] = max(10, min(100, settings.get("steps", 20)))
+    settings["cfg_scale"] = max(1.0, min(20.0, cfg_scale))
+    settings["steps"] = max(10, min(100, steps))
 
     return settings
 
 
-def adapt_captions(captions: Dict[str, str], profile: Dict[str, Any]) -> Dict[str, str]:
-    """Adapt captions according to profile."""
-    captions = captions.copy()
-    style = profile.get("caption_style", CaptionStyle.BALANCED.value)
-
-    if style == CaptionStyle.TECHNICAL.value:
-        captions["narrative"] = f"[Technical Analysis] {captions.get('narrative', '')}"
-        captions["hook"] = f"Technical Overview: {captions.get('hook', '')}"
-    elif style == CaptionStyle.NARRATIVE.value:
-        captions["narrative"] = f"[Story] {captions.get('narrative', '')}"
-        captions["hook"] = f"Story: {captions.get('hook', '')}"
-    elif style == CaptionStyle.ACCESSIBILITY.value:
-        captions["narrative"] = f"[Accessibility] {captions.get('narrative', '')}"
-        if "alt_text" in captions:
-            captions["alt_text"] = f"Detailed description: {captions['alt_text']}"
+# caption style -> (narrative prefix, hook prefix, alt_text prefix); None leaves that field alone
+_CAPTION_PREFIXES: Dict[str, Tuple[str, Optional[str], Optional[str]]] = {
+    _CS_TECHNICAL: ("[Technical Analysis] ", "Technical Overview: ", None),
+    _CS_NARRATIVE: ("[Story] ", "Story: ", None),
+    _CS_ACCESSIBILITY: ("[Accessibility] ", None, "Detailed description: "),
+}
+
 
+def adapt_captions(captions: Dict[str, str], profile: Mapping[str, Any]) -> Dict[str, str]:
+    """Adapt captions according to profile; balanced profiles get the input back unchanged."""
+    prefixes = _CAPTION_PREFIXES.get(profile.get("caption_style", _CS_BALANCED))
+    if prefixes is None:
+        return captions
+
+    narrative_prefix, hook_prefix, alt_prefix = prefixes
+    captions = captions.copy()
+    captions["narrative"] = narrative_prefix + captions.get("narrative", "")
+    if hook_prefix is not None:
+        captions["hook"] = hook_prefix + captions.get("hook", "")
+    if alt_prefix is not None and "alt_text" in captions:
+        captions["alt_text"] = alt_prefix + captions["alt_text"]
     return captions
 
 
+def _known_profile_ids() -> Set[str]:
+    """Ids saved to disk or waiting to be written; reads this without waiting on the writer."""
+    saved = _saved_profile_ids()
+    with _pending_lock:
+        return saved | _pending.keys()
+
+
 def get_profile_stats() -> Dict[str, Any]:
-    _ensure_profiles_dir()
-    profile_files = list(PROFILES_DIR.glob("*.json"))
+    saved = _known_profile_ids()
+    default_meta = _profile_store.get("default", {}).get("metadata", {})
     return {
-        "total_profiles": len(_profile_store),
-        "saved_profiles": len(profile_files),
-        "default_profile_uses": _profile_store.get("default", {}).get("metadata", {}).get("usage_count", 0),
+        "total_profiles": len(_profile_store.keys() | saved),
+        "saved_profiles": len(saved),
+        "default_profile_uses": default_meta.get("usage_count", 0),
     }
 
 
 def list_profiles() -> List[str]:
-    return list(_profile_store.keys())
+    saved = sorted(_known_profile_ids() - _profile_store.keys())
+    return list(_profile_store) + saved
 
 
 def delete_profile(user_id: str) -> bool:
     try:
+        # Let queued writes land first so a pending save cannot recreate the file
+        flush_profiles()
         if user_id in _profile_store:
             del _profile_store[user_id]
-        profile_path = PROFILES_DIR / f"{user_id}.json"
-        if profile_path.exists():
-            profile_path.unlink()
+        with _pending_lock:
+            _pending.pop(user_id, None)  # a save that never reached disk
+        _profile_path(user_id).unlink(missing_ok=True)
+        saved = _saved_profile_ids()
+        with _pending_lock:
+            saved.discard(user_id)
         logger.info(f"Deleted profile for user '{user_id}'")
         return True
     except Exception as e:
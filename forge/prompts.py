@@ -2,8 +2,10 @@
 import re
 import random
 import logging
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, List, Mapping, Optional, Tuple
 from enum import Enum
+from types import MappingProxyType
 
 from forge.resources import validate_resources
 from forge.checkpoints import suggest_checkpoints
@@ -80,81 +82,173 @@ _CONFIG = {
 }
 
 
+# ",  ," -> "," and ". ." -> "." in one pass; the kept mark is whichever group matched
+_DOUBLED_PUNCT_RE = re.compile(r"(,)\s*,|(\.)\s*\.")
+
+
 def clean_prompt(prompt: str) -> str:
+    return clean_prompt_folded(prompt)[0]
+
+
+def clean_prompt_folded(prompt: str) -> Tuple[str, str]:
+    """Clean a prompt and also return its lowercase form, reusing the per-word folding."""
     if not prompt or not isinstance(prompt, str):
-        return ""
-    prompt = re.sub(r"\s+", " ", prompt).strip()
-    prompt = re.sub(r",\s*,", ",", prompt)
-    prompt = re.sub(r"\.\s*\.", ".", prompt)
-    seen, unique_words = set(), []
+        return "", ""
+    # Whitespace needs no pass of its own: split() below drops runs and the ends
+    prompt = _DOUBLED_PUNCT_RE.sub(r"\1\2", prompt)
+    # Lowercase word -> first spelling seen; dicts keep insertion order
+    unique = {}
     for word in prompt.split():
-        if word.lower() not in seen:
-            seen.add(word.lower())
-            unique_words.append(word)
-    return " ".join(unique_words)
+        lower = word.lower()
+        if lower not in unique:
+            unique[lower] = word
+    return " ".join(unique.values()), " ".join(unique)
+
+
+def _weight_patterns(weights: Dict[str, float]) -> Tuple[Tuple[re.Pattern, str], ...]:
+    """(pattern, replacement) pairs, longest keyword first."""
+    return tuple(
+        (re.compile(rf"\b{re.escape(word)}\b", re.IGNORECASE), f"(({word}:{weights[word]}))")
+        for word in sorted(weights, key=len, reverse=True)
+    )
+
+
+# The default keywords never overlap or occur inside one another's replacements, so one
+# left-to-right pass over a longest-first alternation matches the per-keyword subs exactly.
+# Each keyword is its own group; the group index picks the replacement.
+_DEFAULT_WEIGHT_WORDS = sorted(_CONFIG["keyword_weights"], key=len, reverse=True)
+_DEFAULT_WEIGHT_RE = re.compile(
+    r"\b(?:%s)\b" % "|".join(f"({re.escape(word)})" for word in _DEFAULT_WEIGHT_WORDS),
+    re.IGNORECASE,
+)
+_DEFAULT_WEIGHT_REPLACEMENTS = ("",) + tuple(
+    f"(({word}:{_CONFIG['keyword_weights'][word]}))" for word in _DEFAULT_WEIGHT_WORDS
+)
+
+
+def _default_weight_replacement(match: re.Match) -> str:
+    return _DEFAULT_WEIGHT_REPLACEMENTS[match.lastindex]
+
+
+@lru_cache(maxsize=64)
+def _custom_weight_patterns(
+    custom_items: Tuple[Tuple[str, float], ...]
+) -> Tuple[Tuple[re.Pattern, str], ...]:
+    return _weight_patterns({**_CONFIG["keyword_weights"], **dict(custom_items)})
 
 
 def weight_keywords(prompt: str, custom_weights: Optional[Dict] = None) -> str:
     if not prompt:
         return ""
-    weights = {**_CONFIG["keyword_weights"], **(custom_weights or {})}
-    for word in sorted(weights.keys(), key=len, reverse=True):
-        pattern = re.compile(rf"\b{re.escape(word)}\b", re.IGNORECASE)
-        if pattern.search(prompt):
-            prompt = pattern.sub(f"(({word}:{weights[word]}))", prompt)
+    try:
+        # Item order is kept in the key; it breaks ties between equal-length keywords
+        weights_key = tuple(custom_weights.items()) if custom_weights else None
+        return _weight_keywords_cached(prompt, weights_key)
+    except TypeError:
+        return _apply_weights(prompt, custom_weights)
+
+
+@lru_cache(maxsize=1024)
+def _weight_keywords_cached(
+    prompt: str, weights_key: Optional[Tuple[Tuple[str, float], ...]]
+) -> str:
+    return _apply_weights(prompt, dict(weights_key) if weights_key else None)
+
+
+def _apply_weights(prompt: str, custom_weights: Optional[Dict]) -> str:
+    if not custom_weights:
+        return _DEFAULT_WEIGHT_RE.sub(_default_weight_replacement, prompt)
+    try:
+        patterns = _custom_weight_patterns(tuple(custom_weights.items()))
+    except TypeError:
+        patterns = _weight_patterns({**_CONFIG["keyword_weights"], **custom_weights})
+    # Custom keywords may nest inside other replacements, so they keep one pass per keyword
+    for pattern, replacement in patterns:
+        prompt = pattern.sub(replacement, prompt)
     return prompt
 
 
-def analyze_prompt_style(prompt: str) -> Dict[str, float]:
+_STYLE_KEYWORDS = (
+    ("realistic", ("realistic", "photorealistic", "photo", "hyperrealistic")),
+    ("anime", ("anime", "manga", "cel-shaded", "chibi", "kawaii")),
+    ("cyberpunk", ("cyberpunk", "neon", "futuristic", "dystopian")),
+    ("fantasy", ("fantasy", "magical", "dragon", "elf", "wizard")),
+    ("painting", ("oil painting", "watercolor", "acrylic", "impressionist")),
+    ("scifi", ("sci-fi", "spaceship", "alien", "robot", "future")),
+)
+
+
+_STYLE_NAMES = tuple(style for style, _ in _STYLE_KEYWORDS)
+# Scores for an empty prompt (floats) and for a prompt without style keywords (ints)
+_EMPTY_STYLE_SCORES = MappingProxyType(dict.fromkeys(_STYLE_NAMES, 0.0))
+_UNSTYLED_SCORES = MappingProxyType(dict.fromkeys(_STYLE_NAMES, 0))
+# (style index, keyword) flattened so every keyword is checked in one loop
+_STYLE_KEYWORD_INDEX = tuple(
+    (i, keyword) for i, (_, keywords) in enumerate(_STYLE_KEYWORDS) for keyword in keywords
+)
+
+
+def analyze_prompt_style(prompt: str, *, prompt_lower: Optional[str] = None) -> Dict[str, float]:
+    """Score prompt styles; pass prompt_lower when the lowercase prompt is already at hand."""
     if not prompt:
-        return {s: 0.0 for s in ["realistic","anime","cyberpunk","fantasy","painting","scifi"]}
-    prompt_lower = prompt.lower()
-    style_scores = {k: 0 for k in ["realistic","anime","cyberpunk","fantasy","painting","scifi"]}
-    style_keywords = {
-        "realistic": ["realistic", "photorealistic", "photo", "hyperrealistic"],
-        "anime": ["anime", "manga", "cel-shaded", "chibi", "kawaii"],
-        "cyberpunk": ["cyberpunk", "neon", "futuristic", "dystopian"],
-        "fantasy": ["fantasy", "magical", "dragon", "elf", "wizard"],
-        "painting": ["oil painting", "watercolor", "acrylic", "impressionist"],
-        "scifi": ["sci-fi", "spaceship", "alien", "robot", "future"],
-    }
-    for style, keywords in style_keywords.items():
-        for keyword in keywords:
-            if keyword in prompt_lower:
-                style_scores[style] += 1
-    total = sum(style_scores.values())
-    if total:
-        for style in style_scores:
-            style_scores[style] = round(style_scores[style] / total, 2)
-    return style_scores
+        return dict(_EMPTY_STYLE_SCORES)
+    if prompt_lower is None:
+        prompt_lower = prompt.lower()
+    return dict(_style_scores(prompt_lower))
+
+
+@lru_cache(maxsize=2048)
+def _style_scores(prompt_lower: str) -> Mapping[str, float]:
+    # Shared between callers, so read-only; analyze_prompt_style hands out copies
+    counts = [0] * len(_STYLE_NAMES)
+    for i, keyword in _STYLE_KEYWORD_INDEX:
+        if keyword in prompt_lower:
+            counts[i] += 1
+    total = sum(counts)
+    if not total:
+        return _UNSTYLED_SCORES
+    return MappingProxyType(
+        {style: round(count / total, 2) for style, count in zip(_STYLE_NAMES, counts)}
+    )
+
+
+_DEFAULT_NEGATIVE_PROMPT = _CONFIG["negative_prompt"]
+_DEFAULT_NEGATIVE_PROMPT_LEN = len(_DEFAULT_NEGATIVE_PROMPT)
 
 
 def get_negative_prompt(additional_negatives: Optional[List[str]] = None) -> str:
-    neg = _CONFIG["negative_prompt"]
-    if additional_negatives:
-        neg += ", " + ", ".join([n for n in additional_negatives if n])
-    return neg
+    if not additional_negatives:
+        return _DEFAULT_NEGATIVE_PROMPT
+    return _extended_negative_prompt(tuple(additional_negatives))
+
+
+@lru_cache(maxsize=128)
+def _extended_negative_prompt(additional_negatives: Tuple[str, ...]) -> str:
+    return _DEFAULT_NEGATIVE_PROMPT + ", " + ", ".join([n for n in additional_negatives if n])
+
+
+# Read-only per-goal defaults; get_settings returns a fresh dict built from them
+_GOAL_SETTINGS = {goal: MappingProxyType(values) for goal, values in _CONFIG["settings"].items()}
+
+_STYLE_ADJUSTMENTS = {
+    "realistic": {"cfg_scale": -0.5, "steps": 5},
+    "anime": {"cfg_scale": 0.3, "steps": -2},
+    "cyberpunk": {"cfg_scale": 0.7, "steps": 3},
+    "fantasy": {"cfg_scale": 0.4, "steps": 2},
+}
 
 
 def get_settings(goal: str = "t2i", style_analysis: Optional[Dict] = None) -> Dict:
-    if goal not in _CONFIG["settings"]:
+    if goal not in _GOAL_SETTINGS:
         logger.warning(f"Unknown goal '{goal}', defaulting to 't2i'")
         goal = "t2i"
-    settings = _CONFIG["settings"][goal].copy()
-    settings["seed"] = random.randint(1, 999999999)
+    settings = {**_GOAL_SETTINGS[goal], "seed": random.getrandbits(30) or 1}
     if style_analysis:
         dominant_style, score = max(style_analysis.items(), key=lambda x: x[1])
-        if score > 0:
-            style_adjustments = {
-                "realistic": {"cfg_scale": -0.5, "steps": 5},
-                "anime": {"cfg_scale": 0.3, "steps": -2},
-                "cyberpunk": {"cfg_scale": 0.7, "steps": 3},
-                "fantasy": {"cfg_scale": 0.4, "steps": 2},
-            }
-            if dominant_style in style_adjustments:
-                adj = style_adjustments[dominant_style]
-                settings["cfg_scale"] += adj.get("cfg_scale", 0)
-                settings["steps"] += adj.get("steps", 0)
+        if score > 0 and dominant_style in _STYLE_ADJUSTMENTS:
+            adj = _STYLE_ADJUSTMENTS[dominant_style]
+            settings["cfg_scale"] += adj.get("cfg_scale", 0)
+            settings["steps"] += adj.get("steps", 0)
     settings["cfg_scale"] = max(1.0, min(20.0, settings["cfg_scale"]))
     settings["steps"] = max(10, min(100, settings["steps"]))
     settings["denoise"] = max(0.0, min(1.0, settings["denoise"]))
@@ -180,10 +274,8 @@ def optimise_prompt_package(
     try:
         if not prompt or not isinstance(prompt, str):
             raise ValueError("Prompt must be a non-empty string")
-        base_prompt = clean_prompt(prompt)
-        style_analysis = analyze_prompt_style(base_prompt)
-        weighted_prompt = weight_keywords(base_prompt, custom_weights)
-        negative_prompt = get_negative_prompt()
+        base_prompt, style_analysis, weighted_prompt = _process_prompt_text(prompt, custom_weights)
+        negative_prompt = _DEFAULT_NEGATIVE_PROMPT
         settings = get_settings(goal, style_analysis)
         validated_resources = validate_resources(resources or [])
         checkpoint_suggestions = suggest_checkpoints(checkpoint or settings.get("preferred_checkpoint", ""))
@@ -199,7 +291,7 @@ def optimise_prompt_package(
             "diagnostics": diagnostics,
             "metadata": {
                 "prompt_length": len(weighted_prompt or base_prompt),
-                "negative_length": len(negative_prompt),
+                "negative_length": _DEFAULT_NEGATIVE_PROMPT_LEN,
                 "resource_count": len(validated_resources),
                 "word_count": len((weighted_prompt or base_prompt).split()),
             },
@@ -210,6 +302,42 @@ def optimise_prompt_package(
         raise
 
 
+def _process_prompt_text(
+    prompt: str, custom_weights: Optional[Dict]
+) -> Tuple[str, Dict[str, float], str]:
+    """Clean, analyse and weight a prompt, reusing earlier results for repeated inputs."""
+    try:
+        # Insertion order is part of the key, as it is for weight_keywords' pattern cache
+        weights_key = tuple(custom_weights.items()) if custom_weights else None
+        base_prompt, style_analysis, weighted_prompt = _process_prompt_text_cached(
+            prompt, weights_key
+        )
+    except TypeError:
+        base_prompt, style_analysis, weighted_prompt = _process_prompt_text_uncached(
+            prompt, custom_weights
+        )
+    # Callers get their own style dict; the cached one is read-only
+    return base_prompt, dict(style_analysis), weighted_prompt
+
+
+@lru_cache(maxsize=256)
+def _process_prompt_text_cached(
+    prompt: str, weights_key: Optional[Tuple[Tuple[str, float], ...]]
+) -> Tuple[str, Mapping[str, float], str]:
+    base_prompt, style_analysis, weighted_prompt = _process_prompt_text_uncached(
+        prompt, dict(weights_key) if weights_key else None
+    )
+    return base_prompt, MappingProxyType(style_analysis), weighted_prompt
+
+
+def _process_prompt_text_uncached(
+    prompt: str, custom_weights: Optional[Dict]
+) -> Tuple[str, Dict[str, float], str]:
+    base_prompt, base_lower = clean_prompt_folded(prompt)
+    style_analysis = analyze_prompt_style(base_prompt, prompt_lower=base_lower)
+    return base_prompt, style_analysis, weight_keywords(base_prompt, custom_weights)
+
+
 def _build_diagnostics(settings: Dict, goal: str, style_analysis: Dict, resources: List) -> Dict:
     diag = {
         "cfg_reason": f"CFG {settings['cfg_scale']} tuned for {goal} balance",
@@ -92,6 +92,7 @@ def validate_resources(resources: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         raise ValueError("Resources must be provided as a list")
 
     validated_resources = []
+    validated_at = datetime.now(timezone.utc).isoformat()  # one timestamp for the whole batch
 
     for i, resource_input in enumerate(resources):
         try:
@@ -112,7 +113,7 @@ def validate_resources(resources: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
                 if condition(resource) and resource.get(tag_key) == DEFAULT_VALUES.get(tag_key):
                     resource[tag_key] = tag_value
 
-            resource = _validate_and_normalize_resource(resource)
+            resource = _validate_and_normalize_resource(resource, validated_at)
 
             # Stronger unique ID
             resource["id"] = f"res_{uuid.uuid4().hex[:8]}"
@@ -135,7 +136,9 @@ def _detect_resource_type(name: str) -> Optional[ResourceType]:
     return None
 
 
-def _validate_and_normalize_resource(resource: Dict[str, Any]) -> Dict[str, Any]:
+def _validate_and_normalize_resource(
+    resource: Dict[str, Any], validated_at: str
+) -> Dict[str, Any]:
     resource = resource.copy()
 
     if resource["type"] not in [t.value for t in ResourceType]:
@@ -150,7 +153,7 @@ def _validate_and_normalize_resource(resource: Dict[str, Any]) -> Dict[str, Any]
     if "name" in resource:
         resource["name"] = re.sub(r"\s+", " ", str(resource["name"])).strip()
 
-    resource["validated_at"] = datetime.now(timezone.utc).isoformat()
+    resource["validated_at"] = validated_at
     return resource
 
 
@@ -1,6 +1,7 @@
 # forge/safety.py - Enhanced Safety scrubbing logic for Forge
 import re
 import logging
+from functools import lru_cache
 from typing import List, Dict, Any
 
 logger = logging.getLogger(__name__)
@@ -29,6 +30,14 @@ NSFW_PATTERNS = [
     r"\bsex(?:ual)?\b",
 ]
 
+# Compiled once at import; each list collapses into one alternation so a prompt is scanned once
+_BLOCKED_RE = re.compile("|".join(f"(?:{p})" for p in BLOCKED_PATTERNS))
+_NSFW_RE = re.compile("|".join(f"(?:{p})" for p in NSFW_PATTERNS))
+_YOUTH_CODED_RES = tuple(
+    (re.compile(pattern, re.IGNORECASE), replacement)
+    for pattern, replacement in YOUTH_CODED_TOKENS.items()
+)
+
 
 def safety_scrub(prompt: str, allow_nsfw: bool = False) -> str:
     """
@@ -46,26 +55,28 @@ def safety_scrub(prompt: str, allow_nsfw: bool = False) -> str:
     """
     if not isinstance(prompt, str):
         raise ValueError("Prompt must be a string")
+    return _scrub(prompt, bool(allow_nsfw))
+
 
+@lru_cache(maxsize=2048)
+def _scrub(prompt: str, allow_nsfw: bool) -> str:
+    # Prompts repeat across requests; only successful scrubs are cached, violations re-raise
     cleaned_prompt = prompt.strip()
     text_lower = cleaned_prompt.lower()
 
     # 🚫 Hard-block illegal content
-    for pattern in BLOCKED_PATTERNS:
-        if re.search(pattern, text_lower):
-            logger.error(f"[SAFETY] Blocked content detected in prompt → '{prompt[:80]}...'")
-            raise ValueError("Content violation: blocked unsafe content")
+    if _BLOCKED_RE.search(text_lower):
+        logger.error(f"[SAFETY] Blocked content detected in prompt → '{prompt[:80]}...'")
+        raise ValueError("Content violation: blocked unsafe content")
 
     # 🔄 Replace youth-coded tokens
-    for pattern, replacement in YOUTH_CODED_TOKENS.items():
-        cleaned_prompt = re.sub(pattern, replacement, cleaned_prompt, flags=re.IGNORECASE)
+    for pattern, replacement in _YOUTH_CODED_RES:
+        cleaned_prompt = pattern.sub(replacement, cleaned_prompt)
 
     # 🔞 NSFW enforcement
-    if not allow_nsfw:
-        for pattern in NSFW_PATTERNS:
-            if re.search(pattern, text_lower):
-                logger.error(f"[SAFETY] NSFW content detected but not allowed → '{prompt[:80]}...'")
-                raise ValueError("Content violation: NSFW not permitted in current mode")
+    if not allow_nsfw and _NSFW_RE.search(text_lower):
+        logger.error(f"[SAFETY] NSFW content detected but not allowed → '{prompt[:80]}...'")
+        raise ValueError("Content violation: NSFW not permitted in current mode")
 
     return cleaned_prompt
 
@@ -1,7 +1,7 @@
 # forge/settings.py
 import random
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from enum import Enum
 
 logger = logging.getLogger(__name__)
@@ -129,8 +129,8 @@ def build_settings(package_goal: str = "t2i", profile: Optional[Dict[str, Any]]
     if profile:
         settings = _apply_profile_settings(settings, profile, package_goal)
 
-    # Use bounded 32-bit seed
-    settings["seed"] = random.randint(1, 2_147_483_647)
+    # Use bounded 32-bit seed in [1, 2**31 - 1]; getrandbits skips randint's range arithmetic
+    settings["seed"] = random.getrandbits(31) or 1
 
     settings = _validate_and_constrain_settings(settings, package_goal)
     logger.debug(f"Built settings for goal '{package_goal}' with seed {settings['seed']}")
@@ -195,6 +195,22 @@ def get_available_goals() -> list:
     return list(_DEFAULT_SETTINGS.keys())
 
 
+_BASE_MENUS = (
+    "variants", "prompt", "negatives", "config", "workflow",
+    "safety", "version", "rationale", "discard", "help",
+)
+_MENUS_BY_GOAL: Dict[str, Tuple[str, ...]] = {
+    GoalType.I2I.value: _BASE_MENUS + ("denoise",),
+    GoalType.T2V.value: _BASE_MENUS + ("frames", "motion"),
+    GoalType.I2V.value: _BASE_MENUS + ("denoise", "frames", "motion"),
+}
+
+
+def get_menus(package_goal: str) -> Tuple[str, ...]:
+    """Menu entries offered with a package for the given goal."""
+    return _MENUS_BY_GOAL.get(package_goal, _BASE_MENUS)
+
+
 def get_default_settings(goal: str) -> Dict[str, Any]:
     if goal not in _DEFAULT_SETTINGS:
         raise ValueError(f"Unknown goal: {goal}. Available goals: {list(_DEFAULT_SETTINGS.keys())}")
@@ -3,7 +3,7 @@ import random
 from typing import Dict, List, Optional, Any
 
 # Absolute imports from forge package
-from forge.prompts import clean_prompt, analyze_prompt_style, weight_keywords
+from forge.prompts import clean_prompt_folded, analyze_prompt_style, weight_keywords
 
 # Video-specific configuration
 VIDEO_MODELS = {
@@ -20,8 +20,8 @@ def optimise_i2i_package(
     resources: Optional[List[str]] = None,
     caption: Optional[str] = None,
 ) -> Dict[str, Any]:
-    base_prompt = clean_prompt(prompt)
-    intent = analyze_prompt_style(base_prompt)
+    base_prompt, base_lower = clean_prompt_folded(prompt)
+    intent = analyze_prompt_style(base_prompt, prompt_lower=base_lower)
     weighted_prompt = weight_keywords(base_prompt, intent)
 
     settings = _get_base_settings("i2i", intent)
@@ -58,8 +58,8 @@ def optimise_t2v_package(
     resources: Optional[List[str]] = None,
     caption: Optional[str] = None,
 ) -> Dict[str, Any]:
-    base_prompt = clean_prompt(prompt)
-    intent = analyze_prompt_style(base_prompt)
+    base_prompt, base_lower = clean_prompt_folded(prompt)
+    intent = analyze_prompt_style(base_prompt, prompt_lower=base_lower)
     weighted_prompt = _adapt_prompt_for_video(base_prompt, intent, motion_intensity)
 
     settings = _get_video_settings(intent, num_frames, fps, motion_intensity)
@@ -95,8 +95,8 @@ def optimise_i2v_package(
     resources: Optional[List[str]] = None,
     caption: Optional[str] = None,
 ) -> Dict[str, Any]:
-    base_prompt = clean_prompt(prompt)
-    intent = analyze_prompt_style(base_prompt)
+    base_prompt, base_lower = clean_prompt_folded(prompt)
+    intent = analyze_prompt_style(base_prompt, prompt_lower=base_lower)
     weighted_prompt = _adapt_prompt_for_video(base_prompt, intent, motion_intensity)
 
     settings = _get_video_settings(intent, num_frames, fps, motion_intensity)
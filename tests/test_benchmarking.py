@@ -0,0 +1,38 @@
+import pytest
+
+from forge.benchmarking import (
+    BenchmarkCategory,
+    BenchmarkLevel,
+    calculate_overall_score,
+    run_benchmarks,
+)
+
+
+def test_overall_score_is_weighted_mean():
+    benchmarks = {
+        BenchmarkCategory.QUALITY: {"score": 0.9, "weight": 0.3},
+        BenchmarkCategory.SPEED: {"score": 0.6, "weight": 0.1},
+    }
+    assert calculate_overall_score(benchmarks) == pytest.approx(0.825)
+
+
+def test_overall_score_reads_weights_from_results():
+    # Weights come from each result, so keys need not be BenchmarkCategory members
+    benchmarks = {
+        "quality": {"score": 1.0, "weight": 1.0},
+        "custom": {"score": 0.0, "weight": 3.0},
+    }
+    assert calculate_overall_score(benchmarks) == 0.25
+
+
+def test_overall_score_without_weight_is_zero():
+    assert calculate_overall_score({}) == 0.0
+    assert calculate_overall_score({"quality": {"score": 0.9, "weight": 0}}) == 0.0
+
+
+def test_overall_score_of_run_benchmarks():
+    results = run_benchmarks(BenchmarkLevel.BASIC, seed=1)
+    score = calculate_overall_score(results)
+    low = min(r["score"] for r in results.values())
+    high = max(r["score"] for r in results.values())
+    assert low <= score <= high
@@ -0,0 +1,192 @@
+import ipaddress
+import socket
+
+import pytest
+
+pytest.importorskip("requests")
+
+from forge import image_analysis as ia  # noqa: E402
+
+_ADDRESSES = {
+    "public.example": "93.184.216.34",
+    "cdn.example": "2606:2800:220:1:248:1893:25c8:1946",
+    "localhost": "127.0.0.1",
+    "intranet.example": "10.0.0.5",
+    "router.example": "192.168.1.1",
+    "metadata.example": "169.254.169.254",
+    "mapped.example": "::ffff:127.0.0.1",
+}
+
+
+def _fake_getaddrinfo(host, port, *args, **kwargs):
+    try:
+        address = str(ipaddress.ip_address(host))
+    except ValueError:
+        if host not in _ADDRESSES:
+            raise socket.gaierror(f"unknown host {host}") from None
+        address = _ADDRESSES[host]
+    family = socket.AF_INET6 if ":" in address else socket.AF_INET
+    return [(family, socket.SOCK_STREAM, 6, "", (address, port))]
+
+
+class _FakeResponse:
+    def __init__(self, status=200, headers=None, chunks=(b"img",)):
+        self.status_code = status
+        self.headers = headers or {}
+        self.chunks = chunks
+
+    @property
+    def is_redirect(self):
+        return "Location" in self.headers and self.status_code in (301, 302, 303, 307, 308)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size):
+        return iter(self.chunks)
+
+
+class _FakeSession:
+    def __init__(self, responses):
+        self.responses = dict(responses)
+        self.requested = []
+
+    def get(self, url, **kwargs):
+        assert kwargs["allow_redirects"] is False
+        self.requested.append(url)
+        return self.responses[url]
+
+
+@pytest.fixture(autouse=True)
+def fake_dns(monkeypatch):
+    monkeypatch.setattr(socket, "getaddrinfo", _fake_getaddrinfo)
+
+
+def _use_session(monkeypatch, responses):
+    session = _FakeSession(responses)
+    monkeypatch.setattr(ia, "_SESSION", session)
+    return session
+
+
+@pytest.mark.parametrize("url", [
+    "http://public.example/cat.png",
+    "https://cdn.example:8443/cat.png",
+])
+def test_public_hosts_pass(url):
+    ia._check_public_url(url)
+
+
+@pytest.mark.parametrize("url", [
+    "http://localhost/cat.png",
+    "http://127.0.0.1:8080/cat.png",
+    "http://[::1]/cat.png",
+    "http://intranet.example/cat.png",
+    "http://router.example/cat.png",
+    "http://169.254.169.254/latest/meta-data/",
+    "http://metadata.example/latest/meta-data/",
+    "http://[::ffff:127.0.0.1]/cat.png",
+    "http://mapped.example/cat.png",
+    "http://unknown.example/cat.png",
+    "ftp://public.example/cat.png",
+    "file:///etc/passwd",
+])
+def test_non_public_urls_are_rejected(url):
+    with pytest.raises(ValueError):
+        ia._check_public_url(url)
+
+
+def test_fetch_returns_body(monkeypatch):
+    _use_session(monkeypatch, {
+        "http://public.example/cat.png": _FakeResponse(chunks=(b"ab", b"cd")),
+    })
+    assert ia._fetch_image("http://public.example/cat.png") == b"abcd"
+
+
+def test_redirect_target_is_rechecked(monkeypatch):
+    session = _use_session(monkeypatch, {
+        "http://public.example/cat.png": _FakeResponse(
+            302, {"Location": "http://metadata.example/latest/meta-data/"}
+        ),
+    })
+    with pytest.raises(ValueError):
+        ia._fetch_image("http://public.example/cat.png")
+    assert session.requested == ["http://public.example/cat.png"]
+
+
+def test_relative_redirect_is_followed(monkeypatch):
+    session = _use_session(monkeypatch, {
+        "http://public.example/cat.png": _FakeResponse(301, {"Location": "/img/cat.png"}),
+        "http://public.example/img/cat.png": _FakeResponse(chunks=(b"cat",)),
+    })
+    assert ia._fetch_image("http://public.example/cat.png") == b"cat"
+    assert session.requested[-1] == "http://public.example/img/cat.png"
+
+
+def test_redirect_hop_limit(monkeypatch):
+    hops = ia._MAX_IMAGE_REDIRECTS + 1
+    session = _use_session(monkeypatch, {
+        f"http://public.example/{i}": _FakeResponse(302, {"Location": f"/{i + 1}"})
+        for i in range(hops)
+    })
+    with pytest.raises(RuntimeError, match="redirected"):
+        ia._fetch_image("http://public.example/0")
+    assert len(session.requested) == hops
+
+
+def test_declared_content_length_over_cap(monkeypatch):
+    _use_session(monkeypatch, {
+        "http://public.example/big.png": _FakeResponse(
+            headers={"Content-Length": str(ia._MAX_IMAGE_BYTES + 1)}
+        ),
+    })
+    with pytest.raises(RuntimeError, match="too large"):
+        ia._fetch_image("http://public.example/big.png")
+
+
+def test_streamed_body_over_cap(monkeypatch):
+    monkeypatch.setattr(ia, "_MAX_IMAGE_BYTES", 8)
+    _use_session(monkeypatch, {
+        "http://public.example/big.png": _FakeResponse(chunks=(b"12345", b"67890")),
+    })
+    with pytest.raises(RuntimeError, match="exceeds"):
+        ia._fetch_image("http://public.example/big.png")
+
+
+def _fake_envelope(image, mode="basic"):
+    if image == "broken":
+        return {"outcome": "error", "result": None, "message": "Image analysis failed: broken"}
+    return {"outcome": "success", "result": {"mode": mode, "description": image}, "message": ""}
+
+
+def test_analyse_images_keeps_input_order(monkeypatch):
+    monkeypatch.setattr(ia, "analyse_image_with_envelope", _fake_envelope)
+    inputs = [f"image-{i}" for i in range(20)]
+
+    envelopes = ia.analyse_images(inputs, mode="tags", max_workers=4)
+
+    assert [e["result"]["description"] for e in envelopes] == inputs
+    assert all(e["result"]["mode"] == "tags" for e in envelopes)
+
+
+def test_analyse_images_empty_input(monkeypatch):
+    def unexpected(image, mode="basic"):
+        raise AssertionError("no images to analyse")
+
+    monkeypatch.setattr(ia, "analyse_image_with_envelope", unexpected)
+    assert ia.analyse_images([]) == []
+
+
+def test_analyse_images_failure_is_isolated(monkeypatch):
+    monkeypatch.setattr(ia, "analyse_image_with_envelope", _fake_envelope)
+
+    envelopes = ia.analyse_images(["first", "broken", "last"])
+
+    assert [e["outcome"] for e in envelopes] == ["success", "error", "success"]
+    assert envelopes[1]["result"] is None
+    assert envelopes[2]["result"]["description"] == "last"
@@ -0,0 +1,112 @@
+import threading
+
+import pytest
+
+from forge import profiles
+from forge.optimizer import optimise_sealed
+from forge.profiles import DEFAULT_PROFILE, profile_to_dict
+
+
+@pytest.fixture
+def profiles_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(profiles, "PROFILES_DIR", tmp_path)
+    monkeypatch.setattr(profiles, "_profiles_dir_ready", False)
+    monkeypatch.setattr(profiles, "_saved_ids", None)
+    monkeypatch.setattr(profiles, "_WRITE_RETRY_DELAYS", (0, 0))
+    yield tmp_path
+    profiles.flush_profiles()
+    profiles._pending.clear()
+
+
+def _profile(**overrides):
+    profile = profile_to_dict(DEFAULT_PROFILE)
+    profile.update(overrides)
+    return profile
+
+
+def test_profile_checkpoint_and_sampler_reach_config():
+    profile = _profile(
+        preferred_checkpoint="custom-v2.safetensors", preferred_sampler="euler_ancestral"
+    )
+
+    package = optimise_sealed({"prompt": "a cat", "package_goal": "t2i", "profile": profile})
+
+    assert package["config"]["checkpoint"] == "custom-v2.safetensors"
+    assert package["config"]["sampler"] == "euler_ancestral"
+    sampler_node = next(n for n in package["workflow_patch"]["nodes"] if n["node"] == "KSampler")
+    assert sampler_node["params"]["sampler_name"] == "euler_ancestral"
+
+
+def test_pending_save_is_readable_before_it_is_written(profiles_dir, monkeypatch):
+    release = threading.Event()
+    write = profiles._write_profile_file
+
+    def blocked_write(user_id, payload):
+        release.wait(5)
+        write(user_id, payload)
+
+    monkeypatch.setattr(profiles, "_write_profile_file", blocked_write)
+
+    assert profiles.save_profile("alice", _profile(verbosity="verbose"))
+    assert profiles.load_profile("alice")["verbosity"] == "verbose"
+    # Read-only calls see the pending save without waiting for the writer
+    assert "alice" in profiles.list_profiles()
+    assert profiles.get_profile_stats()["saved_profiles"] == 1
+    assert not (profiles_dir / "alice.json").exists()
+
+    release.set()
+    profiles.flush_profiles()
+    assert (profiles_dir / "alice.json").exists()
+    assert "alice" not in profiles._pending
+
+
+def test_flush_writes_profiles_that_load_from_disk(profiles_dir):
+    assert profiles.save_profile("bob", _profile(caption_style="technical"))
+    profiles.flush_profiles()
+
+    assert not profiles._pending
+    loaded = profiles.load_profile("bob")
+    assert loaded["caption_style"] == "technical"
+    assert loaded["metadata"]["usage_count"] == 1
+    assert profiles.list_profiles() == ["default", "bob"]
+
+
+def test_failed_write_is_retried(profiles_dir, monkeypatch):
+    write = profiles._write_profile_file
+    calls = []
+
+    def flaky_write(user_id, payload):
+        calls.append(user_id)
+        if len(calls) < 2:
+            raise OSError("disk full")
+        write(user_id, payload)
+
+    monkeypatch.setattr(profiles, "_write_profile_file", flaky_write)
+
+    assert profiles.save_profile("carol", _profile())
+    profiles.flush_profiles()
+
+    assert calls == ["carol", "carol"]
+    assert (profiles_dir / "carol.json").exists()
+    assert "carol" not in profiles._pending
+
+
+def test_write_that_keeps_failing_stays_pending(profiles_dir, monkeypatch):
+    write = profiles._write_profile_file
+
+    def failing_write(user_id, payload):
+        raise OSError("read-only file system")
+
+    monkeypatch.setattr(profiles, "_write_profile_file", failing_write)
+
+    assert profiles.save_profile("dave", _profile(verbosity="compact"))
+    profiles.flush_profiles()
+
+    assert "dave" in profiles._pending
+    assert profiles.load_profile("dave")["verbosity"] == "compact"
+
+    # The next flush tries again once the disk recovers
+    monkeypatch.setattr(profiles, "_write_profile_file", write)
+    profiles.flush_profiles()
+    assert (profiles_dir / "dave.json").exists()
+    assert "dave" not in profiles._pending